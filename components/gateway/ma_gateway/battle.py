@@ -251,6 +251,6 @@ class BattleGenerator:
             **battle_kwargs,
         )
         logger.info(f"battle_created={battle.uuid}")
-        logger.info(f"battle=\n{json.dumps(battle.as_json_dict(), indent=2)}")
+        logger.info(f"battle=\n{battle.as_json_bytes(indent=True).decode('utf-8')}")
 
         return (battle, a_audio_bytes, b_audio_bytes)
@@ -78,7 +78,7 @@ def _update_battle(battle: Battle):
     _BATTLES[battle.uuid] = battle
     _BUCKET_METADATA.put(
         f"{battle.uuid}.json",
-        io.BytesIO(json.dumps(battle.as_json_dict(), indent=2).encode("utf-8")),
+        io.BytesIO(battle.as_json_bytes(indent=True)),
         allow_overwrite=True,
     )
 
@@ -10,6 +10,7 @@ Install with: pip install -e "components/leaderboard/[gcp]"
 
 import json
 import os
+from typing import Iterator
 
 import pandas as pd
 from datetime import datetime, timezone
@@ -148,19 +149,21 @@ def download_filtered_logs_and_audio(
     print(f"  Skipped (unknown models): {skipped_unknown}")
 
 
-def load_all_raw_logs(log_dir: str) -> list:
-    """Load all JSON log files from a directory."""
+def load_all_raw_logs(log_dir: str) -> Iterator[dict]:
+    """Lazily load all JSON log files from a directory.
+
+    Yields one parsed log at a time so callers can aggregate in a single
+    pass without holding every log in memory.
+    """
     if not os.path.exists(log_dir):
-        return []
-    raw_logs = []
+        return
     for filename in os.listdir(log_dir):
         if filename.endswith(".json"):
             with open(os.path.join(log_dir, filename), "r") as f:
                 try:
-                    raw_logs.append(json.load(f))
+                    yield json.load(f)
                 except json.JSONDecodeError:
                     continue
-    return raw_logs
 
 
 def parse_logs(log_dir, start_date=None, end_date=None):
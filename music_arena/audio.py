@@ -1,12 +1,30 @@
 import enum
+import functools
+import math
 import pathlib
 import subprocess
 from typing import IO, Any
 
+import numba
 import numpy as np
-import resampy
 import soundfile as sf
 
+# (num_zeros, kaiser_beta, rolloff) matching resampy's precomputed filters
+_RESAMPLE_FILTERS = {
+    "kaiser_best": (64, 14.769656459379492, 0.9475937167399596),
+    "kaiser_fast": (16, 8.555, 0.85),
+}
+
+# Largest polyphase filter bank, in coefficients (1 MiB of float32), cached per
+# rate pair; larger banks are replaced by an interpolated phase grid
+_MAX_FILTER_SIZE = 1 << 18
+
+# Frames per block for block-wise decode and encode
+_BLOCK_SIZE = 65536
+
+# Independent accumulators in _peak_abs
+_PEAK_LANES = 16
+
 
 class AudioEncoding(enum.Enum):
     WAV_S16 = "WAV_S16"
@@ -19,6 +37,22 @@ class AudioEncoding(enum.Enum):
         return self.value.lower()[:3]
 
 
+_SF_KWARGS: dict[AudioEncoding, dict[str, Any]] = {
+    AudioEncoding.WAV_S16: {"format": "WAV", "subtype": "PCM_16"},
+    AudioEncoding.WAV_F32: {"format": "WAV", "subtype": "FLOAT"},
+    AudioEncoding.MP3_V0: {
+        "format": "MP3",
+        "bitrate_mode": "VARIABLE",
+        "compression_level": 0,
+    },
+    AudioEncoding.MP3_V2: {
+        "format": "MP3",
+        "bitrate_mode": "VARIABLE",
+        "compression_level": 0.25,
+    },
+}
+
+
 class Audio:
     def __init__(self, samples: np.ndarray, sample_rate: int):
         self.samples = samples
@@ -26,6 +60,17 @@ class Audio:
             raise ValueError("Sample rate must be positive")
         self._sample_rate = sample_rate
 
+    @classmethod
+    def _from_validated(
+        cls, samples_planar: np.ndarray, sample_rate: int, is_view: bool = False
+    ) -> "Audio":
+        """Wraps a known-valid (C, T) float32 buffer, skipping the setters."""
+        audio = cls.__new__(cls)
+        audio._samples_planar = samples_planar
+        audio._is_view = is_view
+        audio._sample_rate = sample_rate
+        return audio
+
     def __len__(self) -> int:
         return self.num_samples
 
@@ -39,30 +84,41 @@ class Audio:
         raise AssertionError("Sample rate should not be changed")
 
     @property
-    def samples(self):
-        return self._samples
+    def samples(self) -> np.ndarray:
+        # (T, C) view onto the planar (C, T) buffer
+        return self._samples_planar.T
 
     @samples.setter
     def samples(self, value: np.ndarray):
+        self._samples_planar = self._validate(value)
+        self._is_view = False
+
+    @staticmethod
+    def _validate(value: np.ndarray) -> np.ndarray:
+        """Checks (T, C) or (T,) samples; returns a contiguous (C, T) float32 array."""
         if value.ndim == 1:
             value = value[:, np.newaxis]
         if value.ndim != 2:
             raise ValueError("Audio samples must be 2D")
-        if value.dtype == np.float64:
-            value = value.astype(np.float32)
-        if value.dtype != np.float32:
+        if value.dtype != np.float32 and value.dtype != np.float64:
             raise TypeError("Audio samples must be float32")
         if value.shape[1] < 1:
             raise ValueError("Audio samples must have at least one channel")
-        self._samples = value
+        planar = value.T
+        if value.dtype == np.float64 or not planar.flags.c_contiguous:
+            # Cast and transpose in one pass into a single contiguous buffer
+            out = np.empty(planar.shape, dtype=np.float32)
+            np.copyto(out, planar, casting="same_kind")
+            planar = out
+        return planar
 
     @property
     def num_samples(self) -> int:
-        return self.samples.shape[0]
+        return self._samples_planar.shape[1]
 
     @property
     def num_channels(self) -> int:
-        return self.samples.shape[1]
+        return self._samples_planar.shape[0]
 
     @property
     def duration(self) -> float:
@@ -70,91 +126,271 @@ class Audio:
 
     @property
     def peak_gain(self) -> float:
-        return float(np.max(np.abs(self.samples)))
+        return float(_peak_abs(self._samples_planar))
 
-    def crop(self, duration: float, offset: float = 0.0) -> "Audio":
-        start_sample = int(offset * self.sample_rate)
+    def _crop_range(self, duration: float, offset: float) -> tuple[int, int]:
+        start_sample = min(int(offset * self.sample_rate), self.num_samples)
         end_sample = start_sample + int(duration * self.sample_rate)
-        return Audio(
-            samples=self.samples[start_sample:end_sample],
-            sample_rate=self.sample_rate,
+        return start_sample, min(max(end_sample, start_sample), self.num_samples)
+
+    def crop(self, duration: float, offset: float = 0.0) -> "Audio":
+        start_sample, end_sample = self._crop_range(duration, offset)
+        # Zero-copy: the crop shares the parent's buffer until written in place
+        return Audio._from_validated(
+            self._samples_planar[:, start_sample:end_sample],
+            self._sample_rate,
+            is_view=True,
+        )
+
+    def crop_and_normalize(
+        self, duration: float, offset: float = 0.0, peak_dbfs: float = 0.0
+    ) -> "Audio":
+        """Equivalent to crop(...).peak_normalize(...) in two passes over the crop."""
+        start_sample, end_sample = self._crop_range(duration, offset)
+        new_samples = np.empty(
+            (self.num_channels, end_sample - start_sample), dtype=np.float32
+        )
+        _crop_normalize(
+            self._samples_planar,
+            start_sample,
+            end_sample,
+            np.float32(dbfs_to_gain(peak_dbfs)),
+            new_samples,
         )
+        return Audio._from_validated(new_samples, self._sample_rate)
 
     def peak_normalize(self, in_place: bool = True, peak_dbfs: float = 0.0) -> "Audio":
+        samples = self._samples_planar
+        peak = float(_peak_abs(samples))
         if in_place:
-            if self.peak_gain > 0.0:
-                self.samples *= dbfs_to_gain(peak_dbfs) / self.peak_gain
+            if peak > 0.0:
+                gain = np.float32(dbfs_to_gain(peak_dbfs) / peak)
+                if self._is_view:
+                    # Copy-on-write so the parent of a crop is left untouched
+                    self._samples_planar = np.multiply(samples, gain)
+                    self._is_view = False
+                else:
+                    np.multiply(samples, gain, out=samples)
             return self
         else:
-            result = Audio(samples=self.samples.copy(), sample_rate=self.sample_rate)
-            return result.peak_normalize(in_place=True)
+            if peak > 0.0:
+                gain = np.float32(dbfs_to_gain(peak_dbfs) / peak)
+                new_samples = np.multiply(samples, gain, out=np.empty_like(samples))
+            else:
+                new_samples = samples.copy()
+            return Audio._from_validated(new_samples, self._sample_rate)
 
-    def resample(self, new_sample_rate: int, **kwargs) -> "Audio":
+    def resample(self, new_sample_rate: int, filter: str = "kaiser_best") -> "Audio":
         if new_sample_rate == self.sample_rate:
             return self
-        new_samples = resampy.resample(
-            self.samples.swapaxes(0, 1), self.sample_rate, new_sample_rate, **kwargs
+        if new_sample_rate <= 0:
+            raise ValueError("Sample rate must be positive")
+        if filter not in _RESAMPLE_FILTERS:
+            raise ValueError(f"Unsupported filter: {filter}")
+        g = math.gcd(self.sample_rate, new_sample_rate)
+        up, down = new_sample_rate // g, self.sample_rate // g
+        taps = _polyphase_filter(up, down, *_RESAMPLE_FILTERS[filter])
+        new_samples = np.empty(
+            (self.num_channels, (self.num_samples * up) // down), dtype=np.float32
         )
-        return Audio(samples=new_samples.swapaxes(0, 1), sample_rate=new_sample_rate)
+        if _is_banked(up, taps.shape[1]):
+            _polyphase_resample(self._samples_planar, taps, up, down, new_samples)
+        else:
+            _interp_polyphase_resample(
+                self._samples_planar, taps, up, down, new_samples
+            )
+        return Audio._from_validated(new_samples, new_sample_rate)
 
     @classmethod
     def from_file(cls, file: str | pathlib.Path | IO) -> "Audio":
-        samples, sample_rate = sf.read(file, dtype="float32")
-        return cls(samples=samples, sample_rate=sample_rate)
+        # Decode block-wise straight into a planar buffer
+        with sf.SoundFile(file) as f:
+            samples = np.empty((f.channels, f.frames), dtype=np.float32)
+            block = np.empty((_BLOCK_SIZE, f.channels), dtype=np.float32)
+            num_read = 0
+            while num_read < f.frames:
+                out = block[: min(_BLOCK_SIZE, f.frames - num_read)]
+                chunk = f.read(dtype="float32", always_2d=True, out=out)
+                if len(chunk) == 0:
+                    break
+                samples[:, num_read : num_read + len(chunk)] = chunk.T
+                num_read += len(chunk)
+            sample_rate = f.samplerate
+        return cls._from_validated(samples[:, :num_read], sample_rate)
 
     def write(
         self,
         file: str | pathlib.Path | IO,
         encoding: AudioEncoding = AudioEncoding.WAV_S16,
     ):
-        sf_write_kwargs: dict[str, Any] = {}
-        if encoding == AudioEncoding.WAV_S16:
-            sf_write_kwargs["format"] = "WAV"
-            sf_write_kwargs["subtype"] = "PCM_16"
-        elif encoding == AudioEncoding.WAV_F32:
-            sf_write_kwargs["format"] = "WAV"
-            sf_write_kwargs["subtype"] = "FLOAT"
-        elif encoding == AudioEncoding.MP3_V0:
-            sf_write_kwargs["format"] = "MP3"
-            sf_write_kwargs["bitrate_mode"] = "VARIABLE"
-            sf_write_kwargs["compression_level"] = 0
-        elif encoding == AudioEncoding.MP3_V2:
-            sf_write_kwargs["format"] = "MP3"
-            sf_write_kwargs["bitrate_mode"] = "VARIABLE"
-            sf_write_kwargs["compression_level"] = 0.25
-        else:
+        if encoding not in _SF_KWARGS:
             raise ValueError(f"Unsupported encoding: {encoding}")
-        sf.write(file, self.samples, self.sample_rate, **sf_write_kwargs)
+        # Interleave one block at a time instead of materializing all of (T, C)
+        interleaved = self._samples_planar.T
+        with sf.SoundFile(
+            file,
+            "w",
+            samplerate=self.sample_rate,
+            channels=self.num_channels,
+            **_SF_KWARGS[encoding],
+        ) as f:
+            if encoding == AudioEncoding.WAV_S16:
+                # Quantize ourselves so libsndfile only copies int16 frames
+                scratch = np.empty((_BLOCK_SIZE, self.num_channels), dtype=np.float32)
+                quantized = np.empty(scratch.shape, dtype=np.int16)
+                for i in range(0, self.num_samples, _BLOCK_SIZE):
+                    block = interleaved[i : i + _BLOCK_SIZE]
+                    s = scratch[: block.shape[0]]
+                    q = quantized[: block.shape[0]]
+                    _quantize_s16(block, s)
+                    np.copyto(q, s, casting="unsafe")
+                    f.write(q)
+            else:
+                for i in range(0, self.num_samples, _BLOCK_SIZE):
+                    f.write(interleaved[i : i + _BLOCK_SIZE])
+
+
+def _quantize_s16(samples: np.ndarray, out: np.ndarray) -> None:
+    # Same rounding as libsndfile's clipped float -> PCM_16 path: round to
+    # 32-bit, then arithmetic shift right by 16 (i.e. floor)
+    np.multiply(samples, np.float32(2.0**31), out=out)
+    np.rint(out, out=out)
+    np.multiply(out, np.float32(2.0**-16), out=out)
+    np.floor(out, out=out)
+    np.clip(out, -32768.0, 32767.0, out=out)
+
+
+@functools.lru_cache(maxsize=16)
+def _polyphase_filter(
+    up: int, down: int, num_zeros: int, beta: float, rolloff: float
+) -> np.ndarray:
+    """Returns a windowed-sinc filter bank, one row per filter phase.
+
+    Has one row per output phase (``up`` rows) when that fits in
+    _MAX_FILTER_SIZE; otherwise rows sample the phase uniformly on [0, 1]
+    for _interp_polyphase_resample to interpolate between.
+    """
+    cutoff = min(1.0, up / down) * rolloff
+    support = num_zeros / cutoff
+    half = int(math.ceil(support))
+    offsets = np.arange(-half + 1, half + 1, dtype=np.float64)
+    if _is_banked(up, offsets.size):
+        phases = np.arange(up, dtype=np.float64) / up
+    else:
+        num_phases = max(_MAX_FILTER_SIZE // offsets.size, 1)
+        phases = np.arange(num_phases + 1, dtype=np.float64) / num_phases
+    d = offsets[np.newaxis, :] - phases[:, np.newaxis]
+    window = np.i0(beta * np.sqrt(np.clip(1.0 - (d / support) ** 2, 0.0, None)))
+    window /= np.i0(beta)
+    window[np.abs(d) > support] = 0.0
+    return (cutoff * np.sinc(cutoff * d) * window).astype(np.float32)
+
+
+def _is_banked(up: int, num_taps: int) -> bool:
+    return up * num_taps <= _MAX_FILTER_SIZE
+
 
+@numba.njit(nogil=True, fastmath=True, cache=True)
+def _peak_abs(samples):
+    # Streaming max(|x|) without materializing np.abs(samples); independent
+    # lanes let the reduction vectorize
+    lanes = np.zeros(_PEAK_LANES, dtype=np.float32)
+    for c in range(samples.shape[0]):
+        row = samples[c]
+        n = row.shape[0] - row.shape[0] % _PEAK_LANES
+        for t in range(0, n, _PEAK_LANES):
+            for k in range(_PEAK_LANES):
+                lanes[k] = max(lanes[k], abs(row[t + k]))
+        for t in range(n, row.shape[0]):
+            lanes[0] = max(lanes[0], abs(row[t]))
+    return lanes.max()
 
+
+@numba.njit(nogil=True, fastmath=True, cache=True)
+def _crop_normalize(samples, start, end, target_peak, out):
+    # Memory-bound, so serial; nogil lets threaded callers run concurrently
+    peak = _peak_abs(samples[:, start:end])
+    gain = target_peak / peak if peak > 0.0 else np.float32(1.0)
+    for c in range(samples.shape[0]):
+        row = samples[c, start:end]
+        out_row = out[c]
+        for t in range(row.shape[0]):
+            out_row[t] = row[t] * gain
+
+
+# Serial and nogil rather than parallel=True: callers resample from worker threads,
+# and Numba's fallback workqueue threading layer aborts on concurrent entry
+@numba.njit(nogil=True, fastmath=True, cache=True)
+def _polyphase_resample(samples, taps, up, down, out):
+    num_channels, num_samples = samples.shape
+    num_taps = taps.shape[1]
+    half = num_taps // 2
+    for n in range(out.shape[1]):
+        pos = n * down
+        phase = pos % up
+        start = pos // up - half + 1
+        lo = max(0, -start)
+        hi = min(num_taps, num_samples - start)
+        for c in range(num_channels):
+            acc = np.float32(0.0)
+            for j in range(lo, hi):
+                acc += samples[c, start + j] * taps[phase, j]
+            out[c, n] = acc
+
+
+@numba.njit(nogil=True, fastmath=True, cache=True)
+def _interp_polyphase_resample(samples, taps, up, down, out):
+    # As _polyphase_resample, but linearly interpolates each output's taps from
+    # a uniformly sampled phase grid instead of indexing one row per phase
+    num_channels, num_samples = samples.shape
+    num_phases = taps.shape[0] - 1
+    num_taps = taps.shape[1]
+    half = num_taps // 2
+    for n in range(out.shape[1]):
+        pos = n * down
+        p = (pos % up) * num_phases / up
+        i = min(int(p), num_phases - 1)
+        w = np.float32(p - i)
+        start = pos // up - half + 1
+        lo = max(0, -start)
+        hi = min(num_taps, num_samples - start)
+        for c in range(num_channels):
+            acc = np.float32(0.0)
+            for j in range(lo, hi):
+                tap = taps[i, j] + w * (taps[i + 1, j] - taps[i, j])
+                acc += samples[c, start + j] * tap
+            out[c, n] = acc
+
+
+@functools.lru_cache(maxsize=64)
 def dbfs_to_gain(dbfs: float) -> float:
     return 10.0 ** (dbfs / 20.0)
 
 
+@functools.lru_cache(maxsize=64)
 def gain_to_dbfs(gain: float) -> float:
-    return 20.0 * np.log10(gain)
+    if gain == 0.0:
+        return -math.inf
+    return 20.0 * math.log10(gain)
 
 
 def ffprobe_metadata(file: str | pathlib.Path) -> dict[str, float | int]:
     if not pathlib.Path(file).exists():
         raise FileNotFoundError(f"File not found: {file}")
-    output = (
-        subprocess.check_output(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration:stream=sample_rate,channels",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                str(file),
-            ]
-        )
-        .decode("utf-8")
-        .strip()
-        .splitlines()
-    )
+    # float() and int() parse ASCII bytes directly, so skip the decode
+    output = subprocess.check_output(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration:stream=sample_rate,channels",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            str(file),
+        ],
+        stdin=subprocess.DEVNULL,
+    ).split()
 
     return {
         "sample_rate": round(float(output[0])),
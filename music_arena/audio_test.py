@@ -3,7 +3,16 @@ import unittest
 
 import numpy as np
 
-from .audio import Audio, AudioEncoding, dbfs_to_gain, ffprobe_metadata, gain_to_dbfs
+from .audio import (
+    _MAX_FILTER_SIZE,
+    _RESAMPLE_FILTERS,
+    Audio,
+    AudioEncoding,
+    _polyphase_filter,
+    dbfs_to_gain,
+    ffprobe_metadata,
+    gain_to_dbfs,
+)
 
 
 class AudioTest(unittest.TestCase):
@@ -45,6 +54,16 @@ class AudioTest(unittest.TestCase):
         self.assertEqual(audio.samples.shape, (44100, 2))
         self.assertEqual(audio.samples.dtype, np.float32)
 
+        # Writes through the (T, C) view land in the underlying buffer
+        samples = np.arange(44100 * 6, dtype=np.float32).reshape(44100, 6)
+        audio.samples = samples
+        self.assertEqual(audio.num_channels, 6)
+        np.testing.assert_array_equal(audio.samples, samples)
+        audio.samples[10, 3] = -1.0
+        audio.samples *= 2.0
+        self.assertEqual(audio.samples[10, 3], -2.0)
+        self.assertEqual(audio.samples[11, 4], samples[11, 4] * 2.0)
+
         # 3D array
         with self.assertRaises(ValueError):
             audio.samples = np.zeros((44100, 2, 2), dtype=np.float32)
@@ -73,6 +92,25 @@ class AudioTest(unittest.TestCase):
         self.assertEqual(audio_re.duration, 1.0)
         self.assertEqual(audio_re.samples.shape, (44100, 2))
 
+        # resample sinusoid and compare to analytic signal
+        t = np.arange(48000) / 48000
+        audio = Audio(np.sin(2 * np.pi * 440.0 * t), 48000)
+        # 48001 is coprime with 48000, so its filter bank is interpolated
+        for sr in [16000, 22050, 44100, 48001, 96000]:
+            audio_re = audio.resample(sr)
+            self.assertEqual(audio_re.num_samples, sr)
+            t_re = np.arange(sr) / sr
+            expected = np.sin(2 * np.pi * 440.0 * t_re)
+            np.testing.assert_allclose(
+                audio_re.samples[1000:-1000, 0], expected[1000:-1000], atol=1e-3
+            )
+
+        taps = _polyphase_filter(48001, 48000, *_RESAMPLE_FILTERS["kaiser_best"])
+        self.assertLessEqual(taps.size, _MAX_FILTER_SIZE + taps.shape[1])
+
+        with self.assertRaises(ValueError):
+            audio.resample(44100, filter="not-a-filter")
+
     def test_write_and_read(self):
         for sr in [8000, 16000, 44100, 48000]:
             for duration in [0.1, 0.5, 1.0, 2.0]:
@@ -118,6 +156,7 @@ class AudioTest(unittest.TestCase):
         self.assertAlmostEqual(gain_to_dbfs(0.5), -6.0, places=1)
         self.assertAlmostEqual(gain_to_dbfs(0.1), -20.0)
         self.assertAlmostEqual(gain_to_dbfs(0.01), -40.0)
+        self.assertEqual(gain_to_dbfs(0.0), float("-inf"))
 
         # Test round-trip conversion
         test_values = [-60, -40, -20, -12, -6, -3, 0, 3, 6]
@@ -180,6 +219,11 @@ class AudioTest(unittest.TestCase):
         short_crop = audio.crop(duration=0.1)
         self.assertEqual(short_crop.num_samples, 4410)
 
+        # In-place edits of a crop should not leak into the original
+        short_crop.peak_normalize(in_place=True)
+        self.assertAlmostEqual(short_crop.peak_gain, 1.0, places=6)
+        np.testing.assert_array_equal(audio.samples, samples)
+
     def test_peak_normalize(self):
         # Test peak_normalize method
 
@@ -212,6 +256,9 @@ class AudioTest(unittest.TestCase):
             audio2.samples, original_samples
         )  # Original unchanged
         self.assertAlmostEqual(normalized2.peak_gain, 1.0, places=6)
+        normalized2 = audio2.peak_normalize(in_place=False, peak_dbfs=-6.0)
+        self.assertAlmostEqual(normalized2.peak_gain, dbfs_to_gain(-6.0), places=6)
+        np.testing.assert_array_equal(audio2.samples, original_samples)
 
         # Test custom peak dBFS
         samples3 = np.zeros((44100, 1), dtype=np.float32)
@@ -228,6 +275,28 @@ class AudioTest(unittest.TestCase):
         zero_audio.peak_normalize(in_place=True)
         np.testing.assert_array_equal(zero_audio.samples, original_zero_samples)
 
+    def test_crop_and_normalize(self):
+        # Should match chained crop + peak_normalize
+        samples = np.random.RandomState(0).randn(44100 * 3, 2).astype(np.float32)
+        audio = Audio(samples, 44100)
+        for duration, offset, peak_dbfs in [
+            (1.0, 0.0, 0.0),
+            (0.5, 1.25, -6.0),
+            (10.0, 2.5, -1.0),
+            (1.0, 5.0, 0.0),
+        ]:
+            result = audio.crop_and_normalize(duration, offset, peak_dbfs)
+            expected = audio.crop(duration, offset).peak_normalize(peak_dbfs=peak_dbfs)
+            self.assertEqual(result.samples.shape, expected.samples.shape)
+            np.testing.assert_allclose(
+                result.samples, expected.samples, rtol=1e-5, atol=1e-6
+            )
+        np.testing.assert_array_equal(audio.samples, samples)
+
+        # Zero audio should not change
+        zero_audio = Audio(np.zeros((44100, 1), dtype=np.float32), 44100)
+        self.assertEqual(zero_audio.crop_and_normalize(0.5).peak_gain, 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
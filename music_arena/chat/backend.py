@@ -1,14 +1,19 @@
 import enum
 import functools
+import importlib.util
 import logging
 from typing import Optional
 
+import httpx
 import openai
 
 from ..secret import get_secret
 
 LOGGER = logging.getLogger(__name__)
 
+# Short JSON responses are streamed so we can hang up once the object closes
+_STREAM_JSON_MAX_TOKENS = 128
+
 
 class ChatBackend(enum.Enum):
     OPENAI_GPT4O = "openai-gpt-4o"
@@ -16,7 +21,70 @@ class ChatBackend(enum.Enum):
 
 @functools.lru_cache
 def _get_openai_client() -> openai.AsyncOpenAI:
-    return openai.AsyncOpenAI(api_key=get_secret("OPENAI_API_KEY"))
+    # Bounded keep-alive pool; HTTP/2 multiplexes concurrent calls when h2 exists
+    http_client = openai.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0
+        ),
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+    return openai.AsyncOpenAI(
+        api_key=get_secret("OPENAI_API_KEY"),
+        http_client=http_client,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
+
+
+class _JSONObjectScanner:
+    """Tracks brace depth (ignoring braces in strings) across streamed chunks."""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> int:
+        """Returns the index just past the closing brace in text, or -1."""
+        for i, c in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif c == "\\":
+                    self.escaped = True
+                elif c == '"':
+                    self.in_string = False
+            elif c == '"':
+                self.in_string = True
+            elif c == "{":
+                self.depth += 1
+                self.started = True
+            elif c == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+async def _openai_stream_json(client: openai.AsyncOpenAI, request_params: dict) -> str:
+    chunks = []
+    scanner = _JSONObjectScanner()
+    stream = await client.chat.completions.create(**request_params, stream=True)
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            end = scanner.feed(delta)
+            if end >= 0:
+                chunks.append(delta[:end])
+                break
+            chunks.append(delta)
+    finally:
+        await stream.close()
+    return "".join(chunks)
 
 
 async def openai_chat_completion(
@@ -51,8 +119,11 @@ async def openai_chat_completion(
     if force_json:
         request_params["response_format"] = {"type": "json_object"}
 
-    response = await client.chat.completions.create(**request_params)
-    response_message = response.choices[0].message.content
+    if force_json and max_tokens <= _STREAM_JSON_MAX_TOKENS:
+        response_message = await _openai_stream_json(client, request_params)
+    else:
+        response = await client.chat.completions.create(**request_params)
+        response_message = response.choices[0].message.content
     LOGGER.debug(f"Response message: {repr(response_message)}")
     return response_message
 
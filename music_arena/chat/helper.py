@@ -3,6 +3,9 @@ import json
 
 from ..path import LIB_DIR
 
+# Stand-in for the user input when pre-rendering prompt templates
+_INPUT_SENTINEL = "\x00"
+
 
 @functools.lru_cache(maxsize=100)
 def load_json_examples(tag: str) -> list[dict]:
@@ -17,3 +20,14 @@ def format_examples(examples: list[dict], template: str) -> str:
         )
         for example in examples
     )
+
+
+@functools.lru_cache(maxsize=32)
+def load_formatted_examples(tag: str, template: str) -> str:
+    return format_examples(load_json_examples(tag), template)
+
+
+def split_on_input(render_fn) -> tuple[str, str]:
+    """Renders a template once and splits it around the user input slot."""
+    prefix, suffix = render_fn(_INPUT_SENTINEL).split(_INPUT_SENTINEL)
+    return prefix, suffix
@@ -1,10 +1,12 @@
+import functools
 import json
 from typing import Optional
 
 from ..dataclass import SimpleTextToMusicPrompt
 from ..exceptions import ChatException, PromptContentException
+from ..helper import json_loads
 from .backend import ChatBackend, chat_completion
-from .helper import format_examples, load_json_examples
+from .helper import load_formatted_examples, split_on_input
 
 PROMPT_V00 = """
 You are a specialized AI assistant that moderates text prompts and lyrics from users. Your task is to determine if the text prompt is appropriate for a music generation model.
@@ -96,21 +98,30 @@ _CONFIGS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _text_input_parts(config: str) -> tuple[str, str]:
+    attrs = _CONFIGS[config]
+    return split_on_input(
+        lambda input: attrs["prompt"].format(
+            rules=attrs["rules"],
+            pre_examples=attrs["pre_examples"],
+            examples=load_formatted_examples(
+                attrs["examples"], attrs["example_template"]
+            ),
+            pre_query=attrs["pre_query"],
+            query=attrs["query"].format(input=input),
+        )
+    )
+
+
 async def prompt_is_okay(
     prompt: SimpleTextToMusicPrompt, config: str = "4o-v00", seed: Optional[int] = None
 ) -> bool:
     if config not in _CONFIGS:
         raise ValueError(f"Invalid config: {config}")
     attrs = _CONFIGS[config]
-    text_input = attrs["prompt"].format(
-        rules=attrs["rules"],
-        pre_examples=attrs["pre_examples"],
-        examples=format_examples(
-            load_json_examples(attrs["examples"]), attrs["example_template"]
-        ),
-        pre_query=attrs["pre_query"],
-        query=attrs["query"].format(input=prompt.prompt),
-    )
+    prefix, suffix = _text_input_parts(config)
+    text_input = prefix + prompt.prompt + suffix
     result = await chat_completion(
         attrs["backend"],
         text_input,
@@ -119,7 +130,7 @@ async def prompt_is_okay(
     )
     result = result.strip()
     try:
-        result_dict = json.loads(result)
+        result_dict = json_loads(result)
         assert "is_okay" in result_dict
     except json.JSONDecodeError:
         raise ChatException("Invalid JSON output")
@@ -1,11 +1,13 @@
+import functools
 import json
 import logging
 from typing import Iterator, Optional
 
 from ..dataclass import DetailedTextToMusicPrompt, SimpleTextToMusicPrompt
 from ..exceptions import ChatException, PromptContentException
+from ..helper import json_loads
 from .backend import ChatBackend, chat_completion
-from .helper import format_examples, load_json_examples
+from .helper import format_examples, load_json_examples, split_on_input
 from .moderate import RULES_V00 as MODERATION_RULES_V00
 
 _LOGGER = logging.getLogger(__name__)
@@ -103,15 +105,8 @@ _ROUTE_CONFIGS = {
 }
 
 
-async def route_prompt(
-    simple_prompt: SimpleTextToMusicPrompt,
-    config: str = "4o-v00",
-    seed: Optional[int] = None,
-) -> DetailedTextToMusicPrompt:
-    if config not in _ROUTE_CONFIGS:
-        raise ValueError(f"Invalid config: {config}")
-    _LOGGER.info(f"Routing prompt: {simple_prompt}")
-
+@functools.lru_cache(maxsize=None)
+def _formatted_examples(config: str) -> str:
     attrs = _ROUTE_CONFIGS[config]
 
     # Load moderation examples
@@ -124,16 +119,37 @@ async def route_prompt(
     all_examples = list(attrs["moderation_convert_fn"](moderation_examples)) + list(
         routing_examples
     )
+    return format_examples(all_examples, attrs["example_template"])
 
-    text_input = attrs["prompt"].format(
-        moderation_rules=attrs["moderation_rules"],
-        routing_rules=attrs["routing_rules"],
-        pre_examples=attrs["pre_examples"],
-        examples=format_examples(all_examples, attrs["example_template"]),
-        pre_query=attrs["pre_query"],
-        query=attrs["query"].format(input=simple_prompt.prompt),
+
+@functools.lru_cache(maxsize=None)
+def _text_input_parts(config: str) -> tuple[str, str]:
+    attrs = _ROUTE_CONFIGS[config]
+    return split_on_input(
+        lambda input: attrs["prompt"].format(
+            moderation_rules=attrs["moderation_rules"],
+            routing_rules=attrs["routing_rules"],
+            pre_examples=attrs["pre_examples"],
+            examples=_formatted_examples(config),
+            pre_query=attrs["pre_query"],
+            query=attrs["query"].format(input=input),
+        )
     )
 
+
+async def route_prompt(
+    simple_prompt: SimpleTextToMusicPrompt,
+    config: str = "4o-v00",
+    seed: Optional[int] = None,
+) -> DetailedTextToMusicPrompt:
+    if config not in _ROUTE_CONFIGS:
+        raise ValueError(f"Invalid config: {config}")
+    _LOGGER.info(f"Routing prompt: {simple_prompt}")
+
+    attrs = _ROUTE_CONFIGS[config]
+    prefix, suffix = _text_input_parts(config)
+    text_input = prefix + simple_prompt.prompt + suffix
+
     result = await chat_completion(
         attrs["backend"],
         text_input,
@@ -143,7 +159,7 @@ async def route_prompt(
     result = result.strip()
 
     try:
-        result_dict = json.loads(result)
+        result_dict = json_loads(result)
         assert "is_okay" in result_dict
     except json.JSONDecodeError:
         raise ChatException("Invalid JSON output")
@@ -1,10 +1,10 @@
 import argparse
 import asyncio
-import json
 import logging
 
 from .. import DetailedTextToMusicPrompt, SimpleTextToMusicPrompt
 from ..chat import generate_lyrics, prompt_is_okay, route_prompt
+from ..helper import json_loads
 
 
 async def main_async():
@@ -18,8 +18,10 @@ async def main_async():
     detailed_prompt = None
     simple_prompt = None
     if args.prompt_path is not None:
-        with open(args.prompt_path, "r") as f:
-            detailed_prompt = DetailedTextToMusicPrompt.from_json_dict(json.load(f))
+        with open(args.prompt_path, "rb") as f:
+            detailed_prompt = DetailedTextToMusicPrompt.from_json_dict(
+                json_loads(f.read())
+            )
     elif args.prompt is not None:
         simple_prompt = SimpleTextToMusicPrompt.from_text(args.prompt)
     else:
@@ -1,7 +1,9 @@
 import argparse
+import glob
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import yaml
 
@@ -19,11 +21,18 @@ from ..docker import (
     system_write_dockerfile,
 )
 from ..env import EXECUTING_IN_CONTAINER
+from ..helper import load_with_file_cache
 from ..path import REPO_DIR
 from ..secret import get_secret_json
 
 CONFIGS_DIR = REPO_DIR / "deploy"
 
+# Command run inside each system container
+_SERVE_CMD_PREFIX = ("python", "-m", "music_arena.cli.system-serve")
+
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class Command:
@@ -31,26 +40,39 @@ class Command:
     comment: Optional[str] = None
     dir: Optional[Path] = None
 
+    def __post_init__(self):
+        # Normalize to list[list[str]]: commands executed one after the other
+        if isinstance(self.command, str):
+            self.command = [[self.command]]
+        elif isinstance(self.command, list):
+            if len(self.command) > 0 and not isinstance(self.command[0], list):
+                self.command = [self.command]
+        else:
+            raise ValueError(f"Invalid command type: {type(self.command)}")
+
 
 def _args_to_cmd(args: dict[str, Any]) -> list[str]:
-    cmd = []
-    for key, value in args.items():
-        if isinstance(value, bool):
-            if value:
-                cmd.append(f"--{key}")
-        else:
-            cmd.append(f"--{key}")
-            cmd.append(str(value))
-    return cmd
+    # True -> bare flag, False -> omitted, anything else -> flag and value
+    return list(
+        chain.from_iterable(
+            (f"--{key}",) if value is True else (f"--{key}", str(value))
+            for key, value in args.items()
+            if value is not False
+        )
+    )
 
 
-def parse_deployment_config(config_path: Path):
-    """Load deployment configuration from yaml file."""
+def _load_yaml(config_path: Path):
     with open(config_path, "r") as f:
-        result = yaml.safe_load(f)
+        result = yaml.load(f, Loader=_YAML_LOADER)
     return result
 
 
+def parse_deployment_config(config_path: Path):
+    """Load deployment configuration from yaml file."""
+    return load_with_file_cache(config_path, _load_yaml, "deploy")
+
+
 def get_frontend_commands(config: Dict[str, Any], config_name: str) -> List[Command]:
     """Generate frontend deployment commands."""
     component = "frontend"
@@ -169,7 +191,9 @@ def get_systems_commands(config: Dict[str, Any], config_name: str) -> List[Comma
     for system_key_str, system_config in systems_config.items():
         system_key = SystemKey.from_string(system_key_str)
         args_cmd = _args_to_cmd(system_config.get("args", {}))
-        port = system_config.get("port", system_port(system_key))
+        port = system_config.get("port")
+        if port is None:
+            port = system_port(system_key)
         port_mapping = [(port, port)]
         args_cmd += ["--port", str(port)]
 
@@ -185,7 +209,7 @@ def get_systems_commands(config: Dict[str, Any], config_name: str) -> List[Comma
                     system_kill_command(system_key, name_suffix=config_name),
                     system_run_command(
                         system_key=system_key,
-                        cmd=["python", "-m", "music_arena.cli.system-serve"] + args_cmd,
+                        cmd=[*_SERVE_CMD_PREFIX, *args_cmd],
                         name_suffix=config_name,
                         gpu_id=system_config.get("gpu", None),
                         port_mapping=port_mapping,
@@ -213,42 +237,50 @@ def get_deployment_commands(
     return commands
 
 
-def generate_tmux_script(config_path: Path, commands: List[Command]) -> str:
-    """Generate tmux script with directory navigation."""
-    session_name = f"MUSIC-ARENA-{config_path.stem.upper()}"
-
-    script_lines = [
-        "#!/bin/bash",
-        "set -e",
-        f"# Generated deployment script for {config_path.stem}",
-        "",
-        f'SESSION_NAME="{session_name}"',
-        "",
-        "# Kill existing session if it exists",
-        'tmux kill-session -t "$SESSION_NAME" 2>/dev/null || true',
-        "",
-        "# Create new tmux session",
-        'tmux new-session -d -s "$SESSION_NAME"',
-        "",
-        "# Launch services",
-    ]
+def _stringify_command(command: list[list[str]]) -> str:
+    return " && ".join(" ".join(cmd) for cmd in command)
+
+
+_TMUX_HEADER = """#!/bin/bash
+set -e
+# Generated deployment script for {stem}
+
+SESSION_NAME="{session_name}"
+
+# Kill existing session if it exists
+tmux kill-session -t "$SESSION_NAME" 2>/dev/null || true
+
+# Create new tmux session
+tmux new-session -d -s "$SESSION_NAME"
 
+# Launch services"""
+
+_TMUX_FOOTER = """
+# Session created successfully!
+echo "Tmux session \\"$SESSION_NAME\\" created successfully!"
+echo "To attach to the session, run: tmux attach-session -t \\"$SESSION_NAME\\""
+echo "To list all sessions, run: tmux list-sessions"
+echo "To kill the session, run: tmux kill-session -t \\"$SESSION_NAME\\""
+
+# Try to attach if we have a terminal available
+if [ -t 0 ]; then
+    echo "Attaching to session..."
+    tmux attach-session -t "$SESSION_NAME"
+else
+    echo "No terminal available for auto-attach. Use the commands above to attach manually."
+fi"""
+
+
+def _emit_tmux(config_path: Path, commands: List[Command]) -> Iterator[str]:
+    yield _TMUX_HEADER.format(
+        stem=config_path.stem,
+        session_name=f"MUSIC-ARENA-{config_path.stem.upper()}",
+    )
+
+    # Chain every window in a single tmux invocation (commands split by \;)
+    tmux_commands = []
     for i, cmd_obj in enumerate(commands):
-        # Build the command string based on the command type
-        if isinstance(cmd_obj.command, str):
-            cmd_str = cmd_obj.command
-        elif isinstance(cmd_obj.command, list):
-            if len(cmd_obj.command) == 0:
-                cmd_str = ""
-            else:
-                if isinstance(cmd_obj.command[0], list):
-                    # list[list[str]] - execute commands one after the other
-                    cmd_str = " && ".join([" ".join(cmd) for cmd in cmd_obj.command])
-                else:
-                    # list[str] - single command
-                    cmd_str = " ".join(cmd_obj.command)
-        else:
-            raise ValueError(f"Invalid command type: {type(cmd_obj.command)}")
+        cmd_str = _stringify_command(cmd_obj.command)
 
         # Add directory navigation if specified
         if cmd_obj.dir:
@@ -256,68 +288,42 @@ def generate_tmux_script(config_path: Path, commands: List[Command]) -> str:
         else:
             full_command = cmd_str
 
-        if i == 0:
-            # First command runs in the initial window
-            script_lines.append(
-                f'tmux send-keys -t "$SESSION_NAME":0 "{full_command}" Enter'
-            )
-        else:
-            # Subsequent commands create new windows
-            script_lines.extend(
-                [
-                    f'tmux new-window -t "$SESSION_NAME"',
-                    f'tmux send-keys -t "$SESSION_NAME":{i} "{full_command}" Enter',
-                ]
-            )
+        if i > 0:
+            # Subsequent commands create new windows (first uses the initial one)
+            tmux_commands.append('new-window -t "$SESSION_NAME"')
+        tmux_commands.append(f'send-keys -t "$SESSION_NAME":{i} "{full_command}" Enter')
+    for j, tmux_command in enumerate(tmux_commands):
+        prefix = "tmux " if j == 0 else "    "
+        suffix = " \\; \\" if j < len(tmux_commands) - 1 else ""
+        yield f"{prefix}{tmux_command}{suffix}"
 
-    script_lines.extend(
-        [
-            "",
-            "# Session created successfully!",
-            'echo "Tmux session \\"$SESSION_NAME\\" created successfully!"',
-            'echo "To attach to the session, run: tmux attach-session -t \\"$SESSION_NAME\\""',
-            'echo "To list all sessions, run: tmux list-sessions"',
-            'echo "To kill the session, run: tmux kill-session -t \\"$SESSION_NAME\\""',
-            "",
-            "# Try to attach if we have a terminal available",
-            "if [ -t 0 ]; then",
-            '    echo "Attaching to session..."',
-            '    tmux attach-session -t "$SESSION_NAME"',
-            "else",
-            '    echo "No terminal available for auto-attach. Use the commands above to attach manually."',
-            "fi",
-        ]
-    )
+    yield _TMUX_FOOTER
 
-    return "\n".join(script_lines)
 
+def generate_tmux_script(config_path: Path, commands: List[Command]) -> str:
+    """Generate tmux script with directory navigation."""
+    return "\n".join(_emit_tmux(config_path, commands))
 
-def generate_basic_script(config_path: Path, commands: List[Command]) -> str:
-    """Generate basic script output with directory navigation."""
-    script_lines = [f"# Deployment commands for {config_path.stem}", "", "set -e", ""]
+
+def _emit_basic(config_path: Path, commands: List[Command]) -> Iterator[str]:
+    yield f"# Deployment commands for {config_path.stem}"
+    yield ""
+    yield "set -e"
+    yield ""
 
     for cmd in commands:
         if cmd.comment:
-            script_lines.append(f"# {cmd.comment}")
+            yield f"# {cmd.comment}"
         if cmd.dir:
-            script_lines.append(f"pushd {cmd.dir}")
-        if isinstance(cmd.command, str):
-            cmd_str = cmd.command
-        elif isinstance(cmd.command, list):
-            if len(cmd.command) == 0:
-                cmd_str = ""
-            else:
-                if isinstance(cmd.command[0], list):
-                    cmd_str = " && ".join([" ".join(cmd) for cmd in cmd.command])
-                else:
-                    cmd_str = " ".join(cmd.command)
-        else:
-            raise ValueError(f"Invalid command type: {type(cmd.command)}")
-        script_lines.append(cmd_str)
+            yield f"pushd {cmd.dir}"
+        yield _stringify_command(cmd.command)
         if cmd.dir:
-            script_lines.append("popd")
+            yield "popd"
+
 
-    return "\n".join(script_lines)
+def generate_basic_script(config_path: Path, commands: List[Command]) -> str:
+    """Generate basic script output with directory navigation."""
+    return "\n".join(_emit_basic(config_path, commands))
 
 
 def generate_deployment_script(
@@ -353,18 +359,14 @@ def main():
     args = parser.parse_args()
 
     deployment_tag = args.deployment_tag
-    config_paths = [
-        p.resolve()
-        for p in CONFIGS_DIR.glob("*.yaml")
-        if p.stem.startswith(deployment_tag)
-    ]
+    config_paths = list(CONFIGS_DIR.glob(f"{glob.escape(deployment_tag)}*.yaml"))
     if len(config_paths) == 0:
         raise FileNotFoundError(
             f"Configuration file starting with {deployment_tag} not found"
         )
     elif len(config_paths) != 1:
         raise ValueError(f"Multiple configuration files starting with {deployment_tag}")
-    config_path = config_paths[0]
+    config_path = config_paths[0].resolve()
 
     print(generate_deployment_script(config_path, args.component, args.tmux))
 
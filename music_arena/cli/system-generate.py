@@ -1,13 +1,14 @@
 import argparse
 import asyncio
-import concurrent.futures
-import json
+import io
 import logging
+import os
 
 from ..audio import AudioEncoding
 from ..chat.route import route_prompt
 from ..dataclass.prompt import DetailedTextToMusicPrompt, SimpleTextToMusicPrompt
 from ..env import CONTAINER_COMPONENT, CONTAINER_SYSTEM_KEY, EXECUTING_IN_CONTAINER
+from ..helper import json_dumps, json_loads
 from ..path import CONTAINER_IO_DIR
 from ..registry import init_system
 from ..system import PromptSupport
@@ -17,9 +18,10 @@ _LOGGER = logging.getLogger(__name__)
 
 def write_response_to_disk(response, stem, generation_idx):
     """Write a single response to disk (audio and lyrics)."""
-    response.audio.write(
-        CONTAINER_IO_DIR / f"{stem}-{generation_idx}.mp3", encoding=AudioEncoding.MP3_V0
-    )
+    # Encode in memory first so the file is written in a single call
+    buffer = io.BytesIO()
+    response.audio.write(buffer, encoding=AudioEncoding.MP3_V0)
+    (CONTAINER_IO_DIR / f"{stem}-{generation_idx}.mp3").write_bytes(buffer.getbuffer())
     if response.lyrics is not None:
         with open(CONTAINER_IO_DIR / f"{stem}-{generation_idx}.txt", "w") as f:
             f.write(response.lyrics)
@@ -64,8 +66,8 @@ async def main_async():
 
     # Construct prompt
     if args.prompt_filename is not None:
-        with open(CONTAINER_IO_DIR / args.prompt_filename, "r") as f:
-            prompt = DetailedTextToMusicPrompt.from_json_dict(json.load(f))
+        with open(CONTAINER_IO_DIR / args.prompt_filename, "rb") as f:
+            prompt = DetailedTextToMusicPrompt.from_json_dict(json_loads(f.read()))
     elif args.prompt is not None:
         if args.route:
             prompt = await route_prompt(SimpleTextToMusicPrompt(prompt=args.prompt))
@@ -81,8 +83,8 @@ async def main_async():
     prompt_output_filename = f"{checksum}.json"
     prompt_output_path = CONTAINER_IO_DIR / prompt_output_filename
     _LOGGER.info(f"Writing prompt to {prompt_output_filename}")
-    with open(prompt_output_path, "w") as f:
-        f.write(json.dumps(prompt.as_json_dict(), indent=2))
+    with open(prompt_output_path, "wb") as f:
+        f.write(json_dumps(prompt.as_json_dict(), indent=True))
     _LOGGER.info(f"Prompt: {prompt}")
 
     # Initialize system
@@ -101,24 +103,29 @@ async def main_async():
         f"Generating {args.num_generations} audio files with seed {args.seed}..."
     )
 
-    # Use ThreadPoolExecutor for concurrent disk writes
-    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-        write_tasks = []
+    # Stream responses and write them in worker threads as they become available,
+    # with at most one MP3 encode per core in flight
+    write_slots = asyncio.Semaphore(
+        max(1, min(os.cpu_count() or 4, args.num_generations))
+    )
 
-        # Stream responses and write them as they become available
-        async for response in system.generate_stream(
-            [prompt] * args.num_generations, args.seed
-        ):
-            # Submit write task (non-blocking)
-            task = executor.submit(
+    async def write_response(response, generation_idx):
+        async with write_slots:
+            await asyncio.to_thread(
                 write_response_to_disk, response, stem, generation_idx
             )
-            write_tasks.append(task)
-            generation_idx += 1
 
-        # Wait for all writes to complete
-        for task in concurrent.futures.as_completed(write_tasks):
-            task.result()  # This will raise any exceptions that occurred
+    write_tasks = []
+    async for response in system.generate_stream(
+        [prompt] * args.num_generations, args.seed
+    ):
+        write_tasks.append(
+            asyncio.create_task(write_response(response, generation_idx))
+        )
+        generation_idx += 1
+
+    # Wait for all writes to complete (raises any exceptions that occurred)
+    await asyncio.gather(*write_tasks)
 
 
 def main():
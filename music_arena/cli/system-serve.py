@@ -17,12 +17,14 @@ from ..env import (
     CONTAINER_SYSTEM_KEY,
     EXECUTING_IN_CONTAINER,
 )
+from ..helper import json_dumps
 from ..registry import init_system
 from ..system import TextToMusicSystem
 
 _SYSTEM: Optional[TextToMusicSystem] = None
 _APP = fastapi.FastAPI()
 _QUEUE: asyncio.Queue = None
+_UNBATCHED_LOCK: asyncio.Lock = None
 _MAX_BATCH_SIZE: int = 1
 _MAX_DELAY: float = 10.0
 
@@ -32,6 +34,8 @@ class QueueItem:
     prompt: DetailedTextToMusicPrompt
     future: asyncio.Future
     timestamp: float
+    # Event loop (monotonic) clock, used for batching deadlines
+    loop_timestamp: float
 
 
 @_APP.get("/health")
@@ -45,11 +49,21 @@ async def generate(prompt_dict: dict):
     prompt = DetailedTextToMusicPrompt.from_json_dict(prompt_dict)
 
     # Create a future to wait for the result
-    future = asyncio.Future()
-    queue_item = QueueItem(prompt=prompt, future=future, timestamp=time.time())
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    queue_item = QueueItem(
+        prompt=prompt,
+        future=future,
+        timestamp=time.time(),
+        loop_timestamp=loop.time(),
+    )
 
-    # Add to queue
-    await _QUEUE.put(queue_item)
+    if _MAX_BATCH_SIZE == 1:
+        # Nothing to batch: skip the queue but still run one request at a time
+        async with _UNBATCHED_LOCK:
+            await process_batch([queue_item])
+    else:
+        await _QUEUE.put(queue_item)
 
     # Wait for result
     try:
@@ -59,7 +73,8 @@ async def generate(prompt_dict: dict):
         raise fastapi.HTTPException(status_code=500, detail=str(e))
 
     result["git_hash"] = CONTAINER_HOST_GIT_HASH
-    return result
+    # Serialize the (mostly base64 audio) payload with orjson directly
+    return fastapi.Response(content=json_dumps(result), media_type="application/json")
 
 
 async def process_batch(batch: List[QueueItem]):
@@ -118,14 +133,14 @@ async def process_batch(batch: List[QueueItem]):
 async def queue_processor():
     """Background task that processes the queue based on batch size and delay constraints."""
     batch = []
+    loop = asyncio.get_running_loop()
 
     while True:
         try:
             # Calculate timeout based on oldest item in current batch
             timeout = None
             if batch:
-                oldest_timestamp = batch[0].timestamp
-                elapsed = time.time() - oldest_timestamp
+                elapsed = loop.time() - batch[0].loop_timestamp
                 timeout = max(0, _MAX_DELAY - elapsed)
 
             # Try to get an item from the queue
@@ -139,6 +154,12 @@ async def queue_processor():
 
                 item = await asyncio.wait_for(_QUEUE.get(), timeout=timeout)
                 batch.append(item)
+                # Drain anything else already queued without re-arming a timer
+                while len(batch) < _MAX_BATCH_SIZE:
+                    try:
+                        batch.append(_QUEUE.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
                 logging.info(f"Added item to batch, current size: {len(batch)}")
 
                 # Process batch if we've reached max batch size
@@ -193,12 +214,10 @@ def main():
     # Set up logging
     logging.basicConfig(level=logging.INFO)
 
-    # Apply nest_asyncio to allow nested event loops
-    nest_asyncio.apply()
-
     # Set global queue parameters
-    global _QUEUE, _MAX_BATCH_SIZE, _MAX_DELAY
+    global _QUEUE, _UNBATCHED_LOCK, _MAX_BATCH_SIZE, _MAX_DELAY
     _QUEUE = asyncio.Queue()
+    _UNBATCHED_LOCK = asyncio.Lock()
     _MAX_BATCH_SIZE = args.max_batch_size
     _MAX_DELAY = args.max_delay
 
@@ -207,10 +226,16 @@ def main():
     _SYSTEM = init_system(CONTAINER_SYSTEM_KEY)
     _SYSTEM.prepare()
 
+    # Only patch the event loop for systems that nest them
+    if _SYSTEM.needs_nested_loop:
+        nest_asyncio.apply()
+
     # Start queue processor as background task
-    @_APP.on_event("startup")
-    async def startup_event():
-        asyncio.create_task(queue_processor())
+    if _MAX_BATCH_SIZE > 1:
+
+        @_APP.on_event("startup")
+        async def startup_event():
+            asyncio.create_task(queue_processor())
 
     # Run server
     uvicorn.run(_APP, host=args.host, port=args.port)
@@ -0,0 +1,29 @@
+import numba
+
+# Integer codes for ListenEvent, matching arena._LISTEN_EVENT_CODES
+PLAY = 0
+PAUSE = 1
+TICK = 2
+STOP = 3
+
+
+@numba.njit(cache=True)
+def sum_listen(events, ts):
+    # Same state machine as arena.sum_listen_time, over int8 codes
+    playing = False
+    last_play = 0.0
+    total_time = 0.0
+    for i in range(events.shape[0]):
+        event = events[i]
+        if event == PLAY:
+            playing = True
+            last_play = ts[i]
+        elif (event == PAUSE or event == TICK) and playing:
+            play_time = ts[i] - last_play
+            if play_time > 0:
+                total_time += play_time
+            if event == PAUSE:
+                playing = False
+            else:
+                last_play = ts[i]
+    return total_time
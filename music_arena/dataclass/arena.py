@@ -1,17 +1,22 @@
 import hashlib
-import json
 import time
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Literal, Optional
 
+import numpy as np
+
 from ..env import CONTAINER_COMPONENT, CONTAINER_HOST_GIT_HASH, EXECUTING_IN_CONTAINER
 from ..helper import create_uuid, salted_checksum
 from ..secret import get_secret
-from .base import MusicArenaDataClass
+from . import _listen_kernel
+from .base import MusicArenaDataClass, _field_names
 from .prompt import DetailedTextToMusicPrompt, SimpleTextToMusicPrompt
 from .system_metadata import SystemKey
 
+# Separates fields in User.checksum so (x, None) and (None, x) differ
+_CHECKSUM_SEP = b"\x1f"
+
 
 class Preference(Enum):
     A = "A"
@@ -27,7 +32,12 @@ class ListenEvent(Enum):
     TICK = "TICK"
 
 
-@dataclass
+# Plain name lookups, avoiding EnumMeta.__getitem__ per listen event
+_PREFERENCE_BY_NAME = Preference.__members__
+_LISTEN_EVENT_BY_NAME = ListenEvent.__members__
+
+
+@dataclass(slots=True)
 class Session(MusicArenaDataClass):
     deployment: Optional[str] = None
     uuid: Optional[str] = None
@@ -50,7 +60,7 @@ class Session(MusicArenaDataClass):
             self.frontend_git_hash = CONTAINER_HOST_GIT_HASH
 
 
-@dataclass
+@dataclass(slots=True)
 class User(MusicArenaDataClass):
     ip: Optional[str] = None
     salted_ip: Optional[str] = None
@@ -59,61 +69,107 @@ class User(MusicArenaDataClass):
 
     def __post_init__(self):
         # Anonymizes on creation for improved user privacy
+        if self.ip is None and self.fingerprint is None:
+            # Nothing to salt (e.g., deserialized users), so skip the secret lookup
+            return
         salt = get_secret("ANONYMIZED_USER_SALT", randomly_initialize=True)
         if self.ip is not None:
             self.salted_ip = salted_checksum(self.ip, salt)
-            del self.ip
+            self.ip = None
         if self.fingerprint is not None:
             self.salted_fingerprint = salted_checksum(self.fingerprint, salt)
-            del self.fingerprint
-        assert self.ip is None and self.fingerprint is None
+            self.fingerprint = None
 
     @property
     def checksum(self) -> str:
-        d = {"salted_ip": self.salted_ip, "salted_fingerprint": self.salted_fingerprint}
-        return hashlib.md5(json.dumps(d, sort_keys=True).encode("utf-8")).hexdigest()
+        parts = (
+            (self.salted_ip or "").encode("utf-8")
+            + _CHECKSUM_SEP
+            + (self.salted_fingerprint or "").encode("utf-8")
+        )
+        return hashlib.blake2b(parts, digest_size=16).hexdigest()
+
+
+# Integer event codes for the compiled listen-time kernel
+_LISTEN_EVENT_CODES = {
+    ListenEvent.PLAY: _listen_kernel.PLAY,
+    ListenEvent.PAUSE: _listen_kernel.PAUSE,
+    ListenEvent.TICK: _listen_kernel.TICK,
+    ListenEvent.STOP: _listen_kernel.STOP,
+}
 
 
 def sum_listen_time(listen_data: list[tuple[ListenEvent, float]]) -> float:
-    last_play = None
+    # The sentinel 0.0 is a valid timestamp, so "playing" tracks whether it is set
+    play, pause, tick = ListenEvent.PLAY, ListenEvent.PAUSE, ListenEvent.TICK
+    playing = False
+    last_play = 0.0
     total_time = 0
     for event, timestamp in listen_data:
-        if event == ListenEvent.PLAY:
+        if event is play:
+            playing = True
             last_play = timestamp
-        elif event in [ListenEvent.PAUSE, ListenEvent.TICK] and last_play is not None:
+        elif playing and (event is tick or event is pause):
             play_time = timestamp - last_play
             if play_time > 0:
                 total_time += play_time
             # For PAUSE, stop tracking; for TICK, continue tracking from this point
-            if event == ListenEvent.PAUSE:
-                last_play = None
-            else:  # event == ListenEvent.TICK
-                last_play = timestamp
+            playing = event is tick
+            last_play = timestamp
     return total_time
 
 
+class _TimedField:
+    """Field that stamps a companion time field on its first non-None assignment."""
+
+    def __init__(self, time_name: str):
+        self.time_name = time_name
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            # Dataclass default
+            return None
+        return obj.__dict__.get(self.name)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        # Stored under the field's own name so vars() and orjson see it as usual
+        d = obj.__dict__
+        d[self.name] = value
+        if value is not None and d.get(self.time_name) is None:
+            d[self.time_name] = time.time()
+
+
+def listen_data_as_arrays(
+    listen_data: list[tuple[ListenEvent, float]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns listen data as parallel (int8 event code, float64 timestamp) arrays."""
+    n = len(listen_data)
+    events = np.fromiter(
+        (_LISTEN_EVENT_CODES[e] for e, _ in listen_data), dtype=np.int8, count=n
+    )
+    timestamps = np.fromiter((t for _, t in listen_data), dtype=np.float64, count=n)
+    return events, timestamps
+
+
+def sum_listen_time_arrays(events: np.ndarray, timestamps: np.ndarray) -> float:
+    """Sums listen time over arrays from listen_data_as_arrays, for bulk analysis."""
+    return float(_listen_kernel.sum_listen(events, timestamps))
+
+
 @dataclass
 class Vote(MusicArenaDataClass):
     a_listen_data: list[tuple[ListenEvent, float]] = field(default_factory=list)
     b_listen_data: list[tuple[ListenEvent, float]] = field(default_factory=list)
-    preference: Optional[Preference] = None
+    preference: Optional[Preference] = _TimedField("preference_time")
     preference_time: Optional[float] = None
-    feedback: Optional[str] = None
-    a_feedback: Optional[str] = None
-    b_feedback: Optional[str] = None
+    feedback: Optional[str] = _TimedField("feedback_time")
+    a_feedback: Optional[str] = _TimedField("feedback_time")
+    b_feedback: Optional[str] = _TimedField("feedback_time")
     feedback_time: Optional[float] = None
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        super().__setattr__(name, value)
-        if name == "preference" and value is not None and self.preference_time is None:
-            super().__setattr__("preference_time", time.time())
-        if (
-            name in ["feedback", "a_feedback", "b_feedback"]
-            and value is not None
-            and self.feedback_time is None
-        ):
-            super().__setattr__("feedback_time", time.time())
-
     def play(self, name: Literal["a", "b"]):
         attr = f"{name}_listen_data"
         getattr(self, attr).append((ListenEvent.PLAY, time.time()))
@@ -140,15 +196,16 @@ class Vote(MusicArenaDataClass):
     @classmethod
     def from_json_dict(cls, d: dict[str, Any]) -> "Vote":
         if d.get("preference") is not None:
-            d["preference"] = Preference[d["preference"]]
+            d["preference"] = _PREFERENCE_BY_NAME[d["preference"]]
+        events = _LISTEN_EVENT_BY_NAME
         if "a_listen_data" in d:
-            d["a_listen_data"] = [(ListenEvent[e], t) for e, t in d["a_listen_data"]]
+            d["a_listen_data"] = [(events[e], t) for e, t in d["a_listen_data"]]
         if "b_listen_data" in d:
-            d["b_listen_data"] = [(ListenEvent[e], t) for e, t in d["b_listen_data"]]
+            d["b_listen_data"] = [(events[e], t) for e, t in d["b_listen_data"]]
         return cls.from_dict(d)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseMetadata(MusicArenaDataClass):
     system_key: Optional[SystemKey] = None
     system_git_hash: Optional[str] = None
@@ -187,7 +244,21 @@ class ResponseMetadata(MusicArenaDataClass):
         return cls.from_dict(d)
 
 
-@dataclass
+# Nested dataclass fields of Battle and their JSON decoders
+_BATTLE_FIELD_DECODERS = (
+    ("prompt", SimpleTextToMusicPrompt.from_json_dict),
+    ("prompt_detailed", DetailedTextToMusicPrompt.from_json_dict),
+    ("prompt_user", User.from_json_dict),
+    ("prompt_session", Session.from_json_dict),
+    ("a_metadata", ResponseMetadata.from_json_dict),
+    ("b_metadata", ResponseMetadata.from_json_dict),
+    ("vote", Vote.from_json_dict),
+    ("vote_user", User.from_json_dict),
+    ("vote_session", Session.from_json_dict),
+)
+
+
+@dataclass(slots=True)
 class Battle(MusicArenaDataClass):
     uuid: Optional[str] = None
     gateway_git_hash: Optional[str] = None
@@ -219,34 +290,22 @@ class Battle(MusicArenaDataClass):
 
     def anonymize(self) -> "Battle":
         """Returns a copy w/ system tags set to none"""
-        return self.copy(
-            a_metadata=self.a_metadata.anonymize() if self.a_metadata else None,
-            b_metadata=self.b_metadata.anonymize() if self.b_metadata else None,
-            timings=[],
-        )
+        # Shallow field copy; skips __post_init__ as self is already initialized
+        cls = type(self)
+        anonymized = object.__new__(cls)
+        for name in _field_names(cls):
+            setattr(anonymized, name, getattr(self, name))
+        anonymized.a_metadata = self.a_metadata.anonymize() if self.a_metadata else None
+        anonymized.b_metadata = self.b_metadata.anonymize() if self.b_metadata else None
+        anonymized.timings = []
+        return anonymized
 
     @classmethod
     def from_json_dict(cls, d: dict[str, Any]) -> "Battle":
-        if d.get("prompt") is not None:
-            d["prompt"] = SimpleTextToMusicPrompt.from_json_dict(d["prompt"])
-        if d.get("prompt_detailed") is not None:
-            d["prompt_detailed"] = DetailedTextToMusicPrompt.from_json_dict(
-                d["prompt_detailed"]
-            )
-        if d.get("prompt_user") is not None:
-            d["prompt_user"] = User.from_json_dict(d["prompt_user"])
-        if d.get("prompt_session") is not None:
-            d["prompt_session"] = Session.from_json_dict(d["prompt_session"])
-        if d.get("a_metadata") is not None:
-            d["a_metadata"] = ResponseMetadata.from_json_dict(d["a_metadata"])
-        if d.get("b_metadata") is not None:
-            d["b_metadata"] = ResponseMetadata.from_json_dict(d["b_metadata"])
-        if d.get("vote") is not None:
-            d["vote"] = Vote.from_json_dict(d["vote"])
-        if d.get("vote_user") is not None:
-            d["vote_user"] = User.from_json_dict(d["vote_user"])
-        if d.get("vote_session") is not None:
-            d["vote_session"] = Session.from_json_dict(d["vote_session"])
+        for k, from_json_dict in _BATTLE_FIELD_DECODERS:
+            v = d.get(k)
+            if v is not None:
+                d[k] = from_json_dict(v)
         if "timings" in d:
             d["timings"] = [(e, t) for e, t in d["timings"]]
         return cls.from_dict(d)
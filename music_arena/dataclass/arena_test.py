@@ -14,6 +14,8 @@ from ..dataclass.arena import (
     Session,
     User,
     Vote,
+    listen_data_as_arrays,
+    sum_listen_time_arrays,
 )
 from ..dataclass.prompt import DetailedTextToMusicPrompt, SimpleTextToMusicPrompt
 from ..dataclass.system_metadata import SystemKey
@@ -69,6 +71,7 @@ class TestUser(unittest.TestCase):
         self.assertIsNone(user.salted_ip)
         self.assertIsNone(user.fingerprint)
         self.assertIsNone(user.salted_fingerprint)
+        mock_get_secret.assert_not_called()
 
     @patch("music_arena.dataclass.arena.get_secret")
     def test_user_ip_anonymization(self, mock_get_secret):
@@ -128,7 +131,14 @@ class TestUser(unittest.TestCase):
         user = User()
         checksum = user.checksum
         self.assertIsInstance(checksum, str)
-        self.assertEqual(len(checksum), 32)  # MD5 hash length
+        self.assertEqual(len(checksum), 32)  # 128-bit digest
+
+    @patch("music_arena.dataclass.arena.get_secret")
+    def test_user_checksum_field_order(self, mock_get_secret):
+        mock_get_secret.return_value = "test-salt"
+        user1 = User(salted_ip="abc")
+        user2 = User(salted_fingerprint="abc")
+        self.assertNotEqual(user1.checksum, user2.checksum)
 
     @patch("music_arena.dataclass.arena.get_secret")
     def test_from_dict(self, mock_get_secret):
@@ -270,6 +280,30 @@ class TestVote(unittest.TestCase):
         listen_time = vote.sum_listen_time("a")
         self.assertEqual(listen_time, 0.0)
 
+    def test_sum_listen_time_long_session(self):
+        vote = Vote()
+
+        base_time = time.time()
+        vote.a_listen_data = [(ListenEvent.PLAY, base_time)]
+        vote.a_listen_data += [(ListenEvent.TICK, base_time + i) for i in range(1, 501)]
+        vote.a_listen_data += [
+            (ListenEvent.PAUSE, base_time + 500.5),
+            (ListenEvent.TICK, base_time + 550.0),  # Ignored while paused
+            (ListenEvent.PLAY, base_time + 600.0),
+            (ListenEvent.STOP, base_time + 601.0),
+            (ListenEvent.TICK, base_time + 602.0),
+        ]
+
+        listen_time = vote.sum_listen_time("a")
+        self.assertAlmostEqual(listen_time, 502.5, places=3)
+
+        events, timestamps = listen_data_as_arrays(vote.a_listen_data)
+        self.assertEqual(events.dtype, np.int8)
+        self.assertEqual(len(timestamps), len(vote.a_listen_data))
+        self.assertAlmostEqual(
+            sum_listen_time_arrays(events, timestamps), 502.5, places=3
+        )
+
     def test_listen_time_properties(self):
         vote = Vote()
 
@@ -1,33 +1,107 @@
+import copy
+import functools
 import json
-from dataclasses import asdict, dataclass, replace
+import operator
+from dataclasses import dataclass, fields, is_dataclass, replace
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Leaf types that deepcopy would return unchanged
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _as_dict(o: Any) -> Any:
+    # Same output as dataclasses.asdict, without deepcopying immutable leaves
+    t = type(o)
+    if t in _ATOMIC_TYPES or isinstance(o, Enum):
+        return o
+    elif is_dataclass(o) and not isinstance(o, type):
+        return {name: _as_dict(getattr(o, name)) for name in _field_names(t)}
+    elif t is list:
+        return [_as_dict(v) for v in o]
+    elif t is tuple:
+        return tuple(_as_dict(v) for v in o)
+    elif t is dict:
+        return {_as_dict(k): _as_dict(v) for k, v in o.items()}
+    elif isinstance(o, tuple) and hasattr(o, "_fields"):
+        return t(*[_as_dict(v) for v in o])
+    elif isinstance(o, (list, tuple)):
+        return t(_as_dict(v) for v in o)
+    elif isinstance(o, dict):
+        return t((_as_dict(k), _as_dict(v)) for k, v in o.items())
+    return copy.deepcopy(o)
+
+
+# Leaf types that JSON encodes as-is
+_JSON_ATOMIC_TYPES = frozenset({type(None), bool, int, float, str})
 
 
 def _as_json(o: Any) -> Any:
-    if isinstance(o, MusicArenaDataClass):
-        return o.as_json_dict()
-    elif isinstance(o, Enum):
-        return o.value
-    elif isinstance(o, tuple):
-        return tuple(_as_json(v) for v in o)
-    elif isinstance(o, list):
+    # Exact-type checks for the common cases; anything else resolves a handler
+    t = type(o)
+    if t in _JSON_ATOMIC_TYPES:
+        return o
+    elif t is list:
         return [_as_json(v) for v in o]
-    elif isinstance(o, dict):
+    elif t is tuple:
+        return tuple([_as_json(v) for v in o])
+    elif t is dict:
         return {k: _as_json(v) for k, v in o.items()}
-    return o
+    handler = _AS_JSON_HANDLERS.get(t)
+    if handler is None:
+        handler = _AS_JSON_HANDLERS[t] = _resolve_as_json_handler(t)
+    return handler(o)
+
+
+def _resolve_as_json_handler(t: type) -> Callable[[Any], Any]:
+    if issubclass(t, MusicArenaDataClass):
+        return t.as_json_dict
+    elif issubclass(t, Enum):
+        return operator.attrgetter("value")
+    elif issubclass(t, tuple):
+        return lambda o: tuple(_as_json(v) for v in o)
+    elif issubclass(t, list):
+        return lambda o: [_as_json(v) for v in o]
+    elif issubclass(t, dict):
+        return lambda o: {k: _as_json(v) for k, v in o.items()}
+    return lambda o: o
+
 
+# Per-type handlers, resolved by subclass checks once per type
+_AS_JSON_HANDLERS: dict[type, Callable[[Any], Any]] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class MusicArenaDataClass:
     def as_dict(self) -> dict[str, Any]:
         """Returns dict of self."""
-        return asdict(self)
+        return _as_dict(self)
 
     def as_json_dict(self) -> dict[str, Any]:
         """Returns dict of self."""
         return _as_json(self.as_dict())
 
+    def as_json_bytes(self, indent: bool = False) -> bytes:
+        """Returns UTF-8 JSON of self."""
+        if orjson is None or type(self).as_json_dict is not _BASE_AS_JSON_DICT:
+            d = self.as_json_dict()
+            return json.dumps(d, indent=2 if indent else None).encode("utf-8")
+        # orjson writes dataclasses and enums directly, skipping the dict tree
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(self, option=option)
+
     def copy(self, **kwargs) -> "MusicArenaDataClass":
         """Returns a copy of self."""
         return replace(self, **kwargs)
@@ -46,3 +120,6 @@ class MusicArenaDataClass:
     def from_json(cls, json_str: str) -> "MusicArenaDataClass":
         """Returns instance of self from JSON string."""
         return cls.from_json_dict(json.loads(json_str))
+
+
+_BASE_AS_JSON_DICT = MusicArenaDataClass.as_json_dict
@@ -1,5 +1,7 @@
+import json
 import unittest
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+from enum import Enum
 from typing import Any, Optional
 
 from .base import MusicArenaDataClass
@@ -33,13 +35,41 @@ class Baz(MusicArenaDataClass):
         return cls.from_dict(d)
 
 
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Qux(MusicArenaDataClass):
+    f: list[tuple[Color, float]] = field(default_factory=list)
+    g: dict[str, list[int]] = field(default_factory=dict)
+    h: Optional[Baz] = None
+
+
 class TestMusicArenaDataclass(unittest.TestCase):
+    def test_as_dict(self):
+        qux = Qux(
+            f=[(Color.RED, 1.0)],
+            g={"x": [1, 2]},
+            h=Baz(d=3, e=Bar(b=2, c=Foo(a=1))),
+        )
+        d = qux.as_dict()
+        self.assertEqual(d, asdict(qux))
+        self.assertIsInstance(d["f"][0], tuple)
+        self.assertIsNot(d["g"]["x"], qux.g["x"])
+
     def test_as_json_dict(self):
         f = Foo(a=1)
         b = Bar(b=2, c=f)
         baz = Baz(d=3, e=b)
         self.assertEqual(baz.as_json_dict(), {"d": 3, "e": {"b": 2, "c": {"a": 1}}})
 
+    def test_as_json_bytes(self):
+        qux = Qux(f=[(Color.RED, 1.0)], h=Baz(d=3, e=Bar(b=2)))
+        expected = json.loads(json.dumps(qux.as_json_dict()))
+        self.assertEqual(json.loads(qux.as_json_bytes()), expected)
+        self.assertEqual(json.loads(qux.as_json_bytes(indent=True)), expected)
+
     def test_from_json_dict(self):
         # Test simple case without nested objects
         d = {"a": 1}
@@ -1,20 +1,63 @@
 import abc
+import functools
 import hashlib
 import json
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Callable, Optional
 
-from .base import MusicArenaDataClass
+from .base import _JSON_ATOMIC_TYPES, MusicArenaDataClass, _as_json, _field_names
+
+_ChecksumItems = tuple[tuple[str, type, Any], ...]
+
+
+def _checksum(items: _ChecksumItems) -> str:
+    d = _as_json({name: v for name, _, v in items})
+    payload = json.dumps(d, sort_keys=True).encode("utf-8")
+    return hashlib.md5(payload, usedforsecurity=False).hexdigest()
+
+
+_cached_checksum = functools.lru_cache(maxsize=4096)(_checksum)
+
+
+def _compile_checksum_items(cls: type) -> Callable[[Any], _ChecksumItems]:
+    # Generates straight-line attribute reads for cls's fields (as dataclasses does
+    # for __init__), avoiding a getattr loop on every checksum. Items carry each
+    # value's type so equal values of different types (30 / 30.0, True / 1) differ
+    lines = ["def _checksum_items(self):", "    items = []"]
+    for name in _field_names(cls):
+        lines.append(f"    v = self.{name}")
+        lines.append("    if v is not None:")
+        lines.append(f"        items.append(({name!r}, type(v), v))")
+    lines.append("    return tuple(items)")
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_checksum_items"]
+
+
+# Compiled _checksum_items per prompt class (a plain dict is cheaper than lru_cache)
+_CHECKSUM_ITEMS_FNS: dict[type, Callable[[Any], _ChecksumItems]] = {}
 
 
 @dataclass
 class BasePrompt(MusicArenaDataClass):
 
+    def _checksum_items(self) -> _ChecksumItems:
+        # Non-None fields read directly, without building as_json_dict
+        cls = type(self)
+        fn = _CHECKSUM_ITEMS_FNS.get(cls)
+        if fn is None:
+            fn = _CHECKSUM_ITEMS_FNS[cls] = _compile_checksum_items(cls)
+        return fn(self)
+
     @property
     def checksum(self) -> str:
-        d = self.as_json_dict()
-        d = {k: v for k, v in d.items() if v is not None}
-        return hashlib.md5(json.dumps(d, sort_keys=True).encode("utf-8")).hexdigest()
+        # Keyed by field values rather than stored on self, so it survives mutation
+        items = self._checksum_items()
+        # Only scalar fields are memoized: containers could hold equal values of
+        # different types (e.g. (30,) / (30.0,)) that the type tags can't tell apart
+        if all(t in _JSON_ATOMIC_TYPES for _, t, _ in items):
+            return _cached_checksum(items)
+        return _checksum(items)
 
 
 @dataclass
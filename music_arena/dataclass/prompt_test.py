@@ -1,7 +1,13 @@
+import hashlib
+import json
 import unittest
 from typing import Optional
 
-from .prompt import DetailedTextToMusicPrompt, SimpleTextToMusicPrompt
+from .prompt import (
+    DetailedTextToMusicPrompt,
+    SimpleTextToMusicPrompt,
+    _cached_checksum,
+)
 
 
 class _ExtendedTextToMusicPrompt(DetailedTextToMusicPrompt):
@@ -100,6 +106,27 @@ class TextToMusicPromptTest(unittest.TestCase):
         self.assertEqual(eprompt.checksum, "f09577079db8a81f475ae94e85ddd3a7")
         self.assertEqual(eprompt.some_new_field, None)
 
+    def test_checksum_equal_values_of_different_types(self):
+        def expected(**kwargs):
+            payload = json.dumps(kwargs, sort_keys=True).encode("utf-8")
+            return hashlib.md5(payload).hexdigest()
+
+        cases = [
+            ({"duration": 30}, {"duration": 30.0}),
+            ({"bpm": True}, {"bpm": 1}),
+        ]
+        for a, b in cases:
+            for first, second in [(a, b), (b, a)]:
+                _cached_checksum.cache_clear()
+                for kwargs in [first, second]:
+                    prompt = DetailedTextToMusicPrompt(
+                        overall_prompt="x", instrumental=True, **kwargs
+                    )
+                    self.assertEqual(
+                        prompt.checksum,
+                        expected(overall_prompt="x", instrumental=True, **kwargs),
+                    )
+
 
 if __name__ == "__main__":
     unittest.main()
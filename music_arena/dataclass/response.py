@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from ..audio import Audio, AudioEncoding
-from .base import MusicArenaDataClass
+from .base import MusicArenaDataClass, _as_dict, _as_json, _field_names
 
 
 @dataclass
@@ -22,11 +22,18 @@ class TextToMusicResponse(BaseResponse):
     custom_timings: list[tuple[str, float]] = field(default_factory=list)
 
     def as_json_dict_with_encoding(self, encoding: AudioEncoding) -> dict[str, Any]:
-        result = super().as_json_dict()
+        # Skips the audio field rather than deep-copying its samples and dropping them
+        result = _as_json(
+            {
+                name: _as_dict(getattr(self, name))
+                for name in _field_names(type(self))
+                if name != "audio"
+            }
+        )
         audio_bytes = io.BytesIO()
         self.audio.write(audio_bytes, encoding=encoding)
-        result["audio_b64"] = base64.b64encode(audio_bytes.getvalue()).decode("utf-8")
-        del result["audio"]
+        # getbuffer() avoids copying the encoded audio out of the buffer
+        result["audio_b64"] = base64.b64encode(audio_bytes.getbuffer()).decode("ascii")
         return result
 
     def as_json_dict(self) -> dict[str, Any]:
@@ -36,10 +43,10 @@ class TextToMusicResponse(BaseResponse):
     @classmethod
     def from_json_dict(cls, d: dict[str, Any]) -> "TextToMusicResponse":
         """Returns instance of self from JSON dict."""
-        if "audio_b64" in d:
-            audio = Audio.from_file(io.BytesIO(base64.b64decode(d["audio_b64"])))
-            d["audio"] = audio
-            del d["audio_b64"]
-        if "custom_timings" in d:
-            d["custom_timings"] = [(e, t) for e, t in d["custom_timings"]]
+        audio_b64 = d.pop("audio_b64", None)
+        if audio_b64 is not None:
+            d["audio"] = Audio.from_file(io.BytesIO(base64.b64decode(audio_b64)))
+        custom_timings = d.get("custom_timings")
+        if custom_timings is not None:
+            d["custom_timings"] = list(map(tuple, custom_timings))
         return cls.from_dict(d)
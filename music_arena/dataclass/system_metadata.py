@@ -1,4 +1,5 @@
 import enum
+import functools
 import pathlib
 from dataclasses import dataclass, field
 from typing import Any, Optional
@@ -13,6 +14,10 @@ class SystemAccess(enum.Enum):
 
 @dataclass
 class SystemKey(MusicArenaDataClass):
+    # Extra slots hold the string form and hash, computed once; keys are treated as
+    # immutable (and shared by from_string), and slots keep them out of JSON output
+    __slots__ = ("system_tag", "variant_tag", "_string", "_hash")
+
     system_tag: str
     variant_tag: str
 
@@ -21,22 +26,43 @@ class SystemKey(MusicArenaDataClass):
             raise ValueError("System tag cannot contain ':'")
         if ":" in self.variant_tag:
             raise ValueError("Variant tag cannot contain ':'")
+        self._string = f"{self.system_tag}:{self.variant_tag}"
+        self._hash = hash(self._string)
 
     def __hash__(self):
-        return hash(self.as_string())
+        return self._hash
+
+    def __reduce__(self):
+        # Rebuild on unpickle: str hashes are salted per process
+        return (type(self), (self.system_tag, self.variant_tag))
 
     def __eq__(self, other):
         if not isinstance(other, SystemKey):
             return False
-        return self.as_string() == other.as_string()
+        return self._string == other._string
 
     def as_string(self) -> str:
-        return f"{self.system_tag}:{self.variant_tag}"
+        return self._string
 
     @classmethod
     def from_string(cls, s: str) -> "SystemKey":
-        system_tag, variant_tag = s.split(":")
-        return cls(system_tag=system_tag, variant_tag=variant_tag)
+        if cls is SystemKey:
+            return _parse_system_key(s)
+        return cls(*_split_system_key(s))
+
+
+def _split_system_key(s: str) -> tuple[str, str]:
+    # Extra colons end up in the variant tag, which __post_init__ rejects
+    system_tag, sep, variant_tag = s.partition(":")
+    if not sep:
+        raise ValueError(f"Invalid system key: {s}")
+    return system_tag, variant_tag
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_system_key(s: str) -> SystemKey:
+    # Keys are never mutated after construction, so parsed keys can be shared
+    return SystemKey(*_split_system_key(s))
 
 
 @dataclass
@@ -67,7 +93,8 @@ class TextToMusicSystemMetadata(MusicArenaDataClass):
     init_kwargs: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
-        self.access = SystemAccess(self.access)
+        if not isinstance(self.access, SystemAccess):
+            self.access = SystemAccess(self.access)
         if self.requires_gpu is None:
             self.requires_gpu = True if self.access == SystemAccess.OPEN else False
 
@@ -82,6 +109,6 @@ class TextToMusicSystemMetadata(MusicArenaDataClass):
 
     @classmethod
     def from_json_dict(cls, d: dict[str, Any]) -> "TextToMusicSystemMetadata":
-        if "access" in d:
+        if "access" in d and not isinstance(d["access"], SystemAccess):
             d["access"] = SystemAccess(d["access"])
         return cls.from_dict(d)
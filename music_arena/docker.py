@@ -1,9 +1,17 @@
+import asyncio
+import functools
 import hashlib
 import logging
 import os
 import pathlib
 import subprocess
-from typing import List, Optional
+from itertools import chain
+from typing import List, Literal, Optional
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 from .dataclass import SystemAccess, SystemKey
 from .env import get_git_summary
@@ -33,6 +41,12 @@ DEFAULT_DOCKER_BASE = {
 _LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _resolved(path: pathlib.Path) -> str:
+    # Host paths are a handful of repo/cache constants; resolve each once
+    return str(path.resolve())
+
+
 def build_command(
     tag: str,
     dockerfile: pathlib.Path,
@@ -50,14 +64,15 @@ def build_command(
         "-t",
         tag,
         "-f",
-        str(dockerfile.resolve()),
+        _resolved(dockerfile),
     ]
 
     # Add build args as separate arguments
-    for k, v in build_args.items():
-        cmd.extend(["--build-arg", f"{k}={v}"])
+    cmd.extend(
+        chain.from_iterable(("--build-arg", f"{k}={v}") for k, v in build_args.items())
+    )
 
-    cmd.append(str(context_dir.resolve()))
+    cmd.append(_resolved(context_dir))
     return cmd
 
 
@@ -92,20 +107,19 @@ def run_command(
         command.extend(["--user", f"{user_id}"])
 
     # Port mapping
-    for host_port, container_port in port_mapping:
-        command.extend(["-p", f"{host_port}:{container_port}"])
+    command.extend(chain.from_iterable(("-p", f"{h}:{c}") for h, c in port_mapping))
 
     # Volume mapping
-    for host_path, container_path in volume_mapping:
-        command.extend(["-v", f"{host_path.resolve()}:{container_path}"])
+    command.extend(
+        chain.from_iterable(("-v", f"{_resolved(h)}:{c}") for h, c in volume_mapping)
+    )
 
     # Environment variables
-    for var_name, var_value in env_vars.items():
-        command.extend(["-e", f"{var_name}={var_value}"])
+    command.extend(chain.from_iterable(("-e", f"{k}={v}") for k, v in env_vars.items()))
 
     # Network
     if requires_host_mapping:
-        command.extend(["--add-host=host.docker.internal:host-gateway"])
+        command.append("--add-host=host.docker.internal:host-gateway")
 
     # Entrypoint
     if entrypoint is not None:
@@ -135,23 +149,41 @@ def system_dockerfile(system_key: SystemKey) -> str:
         docker_base = DEFAULT_DOCKER_BASE[metadata.access]
     module_name = metadata.module_name
 
-    # Assemble Dockerfile from mixins
+    # Assemble Dockerfile from mixins; one directory listing replaces per-file stats
     mixin_dir = metadata.registry_dir / "Dockermixins"
-    paths = [
-        REPO_DIR / "Dockerfile",
-        mixin_dir / f"{module_name}.Dockerfile",
-        mixin_dir / f"{module_name}.{system_key.system_tag}.Dockerfile",
-        mixin_dir
-        / f"{module_name}.{system_key.system_tag}.{system_key.variant_tag}.Dockerfile",
+    try:
+        present = {entry.name for entry in os.scandir(mixin_dir)}
+    except (FileNotFoundError, NotADirectoryError):
+        present = set()
+    names = [
+        f"{module_name}.Dockerfile",
+        f"{module_name}.{system_key.system_tag}.Dockerfile",
+        f"{module_name}.{system_key.system_tag}.{system_key.variant_tag}.Dockerfile",
     ]
-    parts = []
+    paths = [REPO_DIR / "Dockerfile"]
+    paths.extend(mixin_dir / name for name in names if name in present)
+    # Stat once; mtimes in the cache key invalidate it when a mixin changes
+    stats = []
     for path in paths:
-        if path.exists():
-            with open(path) as f:
-                parts.append(f.read())
+        try:
+            st = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        stats.append((path, st.st_mtime_ns, st.st_size))
     assert (
-        len(parts) > 0
+        len(stats) > 0
     ), f"No Dockerfile found for {system_key.system_tag}.{system_key.variant_tag}"
+    return _assemble_dockerfile(tuple(stats), docker_base)
+
+
+@functools.lru_cache(maxsize=256)
+def _assemble_dockerfile(
+    stats: tuple[tuple[pathlib.Path, int, int], ...], docker_base: str
+) -> str:
+    parts = []
+    for path, _, _ in stats:
+        with open(path) as f:
+            parts.append(f.read())
     dockerfile = "\n\n".join(parts)
 
     # Replace base container
@@ -170,10 +202,24 @@ def system_dockerfile_path(system_key: SystemKey) -> pathlib.Path:
     )
 
 
-def system_port(system_key: SystemKey) -> int:
-    key = f"{system_key.system_tag}.{system_key.variant_tag}".encode("utf-8")
-    hash_bytes = hashlib.sha256(key).digest()[:8]
-    hash_val = int.from_bytes(hash_bytes, byteorder="big", signed=False)
+def system_port(
+    system_key: SystemKey, hash_strategy: Literal["sha256", "xxh3"] = "sha256"
+) -> int:
+    return _system_port(system_key.system_tag, system_key.variant_tag, hash_strategy)
+
+
+@functools.lru_cache(maxsize=1024)
+def _system_port(system_tag: str, variant_tag: str, hash_strategy: str) -> int:
+    key = f"{system_tag}.{variant_tag}".encode("utf-8")
+    if hash_strategy == "sha256":
+        hash_bytes = hashlib.sha256(key, usedforsecurity=False).digest()[:8]
+        hash_val = int.from_bytes(hash_bytes, byteorder="big", signed=False)
+    elif hash_strategy == "xxh3":
+        if xxhash is None:
+            raise ImportError("xxhash is required for hash_strategy='xxh3'")
+        hash_val = xxhash.xxh3_64_intdigest(key)
+    else:
+        raise ValueError(f"Unknown hash strategy: {hash_strategy}")
     return 15000 + hash_val % 10000
 
 
@@ -304,6 +350,69 @@ def system_execute_command(
         subprocess.run(run_cmd)
 
 
+async def _run_async(cmd: List[str], check: bool = False) -> None:
+    process = await asyncio.create_subprocess_exec(*cmd)
+    returncode = await process.wait()
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+async def system_execute_command_async(
+    system_key: SystemKey,
+    cmd: List[str] = [],
+    *,
+    name_suffix: Optional[str] = "",
+    skip_kill: bool = False,
+    skip_build: bool = False,
+    gpu_id: Optional[str] = None,
+    port_mapping: List[tuple[int, int]] = [],
+    build_semaphore: Optional[asyncio.Semaphore] = None,
+) -> None:
+    """Async system_execute_command, so a launcher can build many systems at once."""
+    tag = system_docker_tag(system_key)
+    if not skip_build:
+        dockerfile_path = system_dockerfile_path(system_key)
+        system_write_dockerfile(system_key, dockerfile_path)
+        build_cmd = system_build_command(system_key, dockerfile_path)
+        _LOGGER.info(f"Building container {tag} from {dockerfile_path} via:")
+        _LOGGER.info(" ".join(build_cmd))
+        if build_semaphore is None:
+            await _run_async(build_cmd, check=True)
+        else:
+            async with build_semaphore:
+                await _run_async(build_cmd, check=True)
+        _LOGGER.info(f"Container {tag} built successfully.")
+
+    if len(cmd) > 0:
+        if not skip_kill:
+            await _run_async(system_kill_command(system_key, name_suffix=name_suffix))
+        run_cmd = system_run_command(
+            system_key,
+            cmd,
+            name_suffix=name_suffix,
+            gpu_id=gpu_id,
+            port_mapping=port_mapping,
+        )
+        _LOGGER.info(f"Running command in container {tag}:")
+        _LOGGER.info(" ".join(run_cmd))
+        await _run_async(run_cmd)
+
+
+async def systems_build_async(
+    system_keys: List[SystemKey], max_concurrency: Optional[int] = None
+) -> None:
+    """Builds containers for several systems concurrently."""
+    if max_concurrency is None:
+        max_concurrency = os.cpu_count() or 1
+    semaphore = asyncio.Semaphore(max_concurrency)
+    await asyncio.gather(
+        *(
+            system_execute_command_async(k, build_semaphore=semaphore)
+            for k in system_keys
+        )
+    )
+
+
 def base_build_command(dockerfile_path: Optional[pathlib.Path] = None) -> List[str]:
     if dockerfile_path is None:
         dockerfile_path = REPO_DIR / "Dockerfile"
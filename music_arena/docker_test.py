@@ -1,7 +1,10 @@
+import asyncio
+import contextlib
 import pathlib
+import subprocess
 import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from .dataclass import SystemAccess, SystemKey
 from .docker import (
@@ -13,14 +16,28 @@ from .docker import (
     system_dockerfile,
     system_dockerfile_path,
     system_execute_command,
+    system_execute_command_async,
     system_port,
     system_run_command,
     system_write_dockerfile,
+    systems_build_async,
+    xxhash,
 )
 from .registry import get_registered_systems
 
 
 class DockerTest(unittest.TestCase):
+    def setUp(self):
+        self._patches = contextlib.ExitStack()
+        mock_get_metadata = self._patches.enter_context(
+            patch("music_arena.docker.get_system_metadata")
+        )
+        self.mock_metadata = MagicMock()
+        mock_get_metadata.return_value = self.mock_metadata
+
+    def tearDown(self):
+        self._patches.close()
+
     def test_build_command_basic(self):
         """Test basic docker build command generation."""
         dockerfile = pathlib.Path("/path/to/Dockerfile")
@@ -126,17 +143,11 @@ class DockerTest(unittest.TestCase):
         # Check that the command is appended at the end
         self.assertEqual(result[-4:], cmd)
 
-    @patch("music_arena.docker.get_system_metadata")
-    @patch("music_arena.docker.SYSTEMS_DIR", pathlib.Path("/fake/systems"))
-    @patch("music_arena.docker.REPO_DIR", pathlib.Path("/fake/repo"))
-    def test_system_dockerfile(self, mock_get_metadata):
+    def test_system_dockerfile(self):
         """Test system dockerfile generation."""
-        # Mock system metadata
-        mock_metadata = MagicMock()
-        mock_metadata.docker_base = None
-        mock_metadata.access = SystemAccess.OPEN
-        mock_metadata.module_name = "test_module"
-        mock_get_metadata.return_value = mock_metadata
+        self.mock_metadata.docker_base = None
+        self.mock_metadata.access = SystemAccess.OPEN
+        self.mock_metadata.module_name = "test_module"
 
         # Create temporary files to simulate Dockerfile mixins
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -173,6 +184,25 @@ class DockerTest(unittest.TestCase):
                 self.assertIn("RUN echo 'base'", result)
                 self.assertIn("RUN echo 'module'", result)
 
+    def test_system_dockerfile_mixin_dir_not_a_directory(self):
+        """Test that a registry path that is a file means no mixins, not an error."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = pathlib.Path(tmp_dir)
+            (tmp_path / "Dockerfile").write_text(
+                "ARG BASE_CONTAINER\nFROM ${BASE_CONTAINER}\nRUN echo 'base'"
+            )
+            registry_file = tmp_path / "registry"
+            registry_file.write_text("")
+            self.mock_metadata.docker_base = "base-image"
+            self.mock_metadata.module_name = "test_module"
+            self.mock_metadata.registry_dir = registry_file
+            with patch("music_arena.docker.REPO_DIR", tmp_path):
+                result = system_dockerfile(
+                    SystemKey(system_tag="test_system", variant_tag="test_variant")
+                )
+            self.assertIn('ARG BASE_CONTAINER="base-image"', result)
+            self.assertIn("RUN echo 'base'", result)
+
     def test_system_dockerfile_path(self):
         """Test system dockerfile path generation."""
         system_key = SystemKey(system_tag="test_system", variant_tag="test_variant")
@@ -203,6 +233,13 @@ class DockerTest(unittest.TestCase):
         port2 = system_port(system_key)
         self.assertEqual(port1, port2)
 
+    @unittest.skipIf(xxhash is None, "xxhash not installed")
+    def test_system_port_xxh3(self):
+        system_key = SystemKey(system_tag="foo", variant_tag="bar")
+        expected = 15000 + xxhash.xxh3_64_intdigest(b"foo.bar") % 10000
+        self.assertEqual(system_port(system_key, hash_strategy="xxh3"), expected)
+        self.assertEqual(system_port(system_key, hash_strategy="sha256"), 19079)
+
     @patch("music_arena.docker.system_dockerfile")
     def test_system_write_dockerfile(self, mock_dockerfile):
         """Test writing system dockerfile to disk."""
@@ -225,7 +262,6 @@ class DockerTest(unittest.TestCase):
         expected = "music-arena-sys-test_system-test_variant"
         self.assertEqual(result, expected)
 
-    @patch("music_arena.docker.get_system_metadata")
     @patch("music_arena.docker.get_secret")
     @patch("music_arena.docker.get_secret_var_name")
     @patch("music_arena.docker.system_dockerfile_path")
@@ -236,13 +272,9 @@ class DockerTest(unittest.TestCase):
         mock_dockerfile_path,
         mock_get_secret_var_name,
         mock_get_secret,
-        mock_get_metadata,
     ):
         """Test system build command generation."""
-        # Mock dependencies
-        mock_metadata = MagicMock()
-        mock_metadata.secrets = ["SECRET1", "SECRET2"]
-        mock_get_metadata.return_value = mock_metadata
+        self.mock_metadata.secrets = ["SECRET1", "SECRET2"]
 
         mock_get_secret_var_name.side_effect = lambda x: f"{x}_VAR"
         mock_get_secret.side_effect = lambda x: f"secret_value_{x}"
@@ -271,14 +303,10 @@ class DockerTest(unittest.TestCase):
         self.assertEqual(build_args["SECRET1_VAR"], "secret_value_SECRET1")
         self.assertEqual(build_args["SECRET2_VAR"], "secret_value_SECRET2")
 
-    @patch("music_arena.docker.get_system_metadata")
     @patch("music_arena.docker.run_command")
-    def test_system_run_command(self, mock_run_command, mock_get_metadata):
+    def test_system_run_command(self, mock_run_command):
         """Test system run command generation."""
-        # Mock metadata
-        mock_metadata = MagicMock()
-        mock_metadata.requires_gpu = False
-        mock_get_metadata.return_value = mock_metadata
+        self.mock_metadata.requires_gpu = False
 
         mock_run_command.return_value = ["docker", "run", "..."]
 
@@ -306,12 +334,9 @@ class DockerTest(unittest.TestCase):
         self.assertIn("volume_mapping", kwargs)
         self.assertGreater(len(kwargs["volume_mapping"]), 0)
 
-    @patch("music_arena.docker.get_system_metadata")
-    def test_system_run_command_gpu_required_error(self, mock_get_metadata):
+    def test_system_run_command_gpu_required_error(self):
         """Test system run command raises error when GPU required but not provided."""
-        mock_metadata = MagicMock()
-        mock_metadata.requires_gpu = True
-        mock_get_metadata.return_value = mock_metadata
+        self.mock_metadata.requires_gpu = True
 
         system_key = SystemKey(system_tag="test_system", variant_tag="test_variant")
         with self.assertRaises(ValueError) as cm:
@@ -366,6 +391,39 @@ class DockerTest(unittest.TestCase):
         # subprocess.run called twice (kill + run)
         self.assertEqual(mock_subprocess_run.call_count, 2)
 
+    @patch("music_arena.docker.system_write_dockerfile")
+    @patch("music_arena.docker.system_build_command")
+    @patch("music_arena.docker.system_run_command")
+    @patch("music_arena.docker.asyncio.create_subprocess_exec")
+    def test_system_execute_command_async(
+        self,
+        mock_create_subprocess_exec,
+        mock_system_run_command,
+        mock_system_build_command,
+        mock_system_write_dockerfile,
+    ):
+        """Test async system execute command and concurrent builds."""
+        process = MagicMock()
+        process.wait = AsyncMock(return_value=0)
+        mock_create_subprocess_exec.return_value = process
+        mock_system_build_command.return_value = ["docker", "build", "..."]
+        mock_system_run_command.return_value = ["docker", "run", "..."]
+
+        system_key = SystemKey(system_tag="test_system", variant_tag="test_variant")
+        asyncio.run(system_execute_command_async(system_key, cmd=["python", "test.py"]))
+        # build + kill + run
+        self.assertEqual(mock_create_subprocess_exec.call_count, 3)
+
+        mock_create_subprocess_exec.reset_mock()
+        other_key = SystemKey(system_tag="other_system", variant_tag="test_variant")
+        asyncio.run(systems_build_async([system_key, other_key], max_concurrency=1))
+        self.assertEqual(mock_create_subprocess_exec.call_count, 2)
+
+        # Failed builds raise like subprocess.run(check=True)
+        process.wait = AsyncMock(return_value=1)
+        with self.assertRaises(subprocess.CalledProcessError):
+            asyncio.run(systems_build_async([system_key]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,8 @@
+import functools
 import os
+import pathlib
 import subprocess
+from typing import Optional
 
 from .dataclass.system_metadata import SystemKey
 
@@ -15,12 +18,44 @@ if CONTAINER_SYSTEM_TAG is not None and CONTAINER_VARIANT_TAG is not None:
 else:
     CONTAINER_SYSTEM_KEY = None
 CACHE_DIR_VAR = os.getenv("MUSIC_ARENA_CACHE_DIR")
+# Not path.REPO_DIR, which imports this module
+_GIT_DIR = pathlib.Path(__file__).parent.parent / ".git"
 
 
+def _read_git_head(git_dir: pathlib.Path) -> Optional[str]:
+    # Resolves HEAD without forking git; None for layouts this doesn't handle
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if not head.startswith("ref: "):
+        return head
+    ref = head[len("ref: ") :]
+    try:
+        return (git_dir / ref).read_text().strip()
+    except OSError:
+        pass
+    try:
+        packed_refs = (git_dir / "packed-refs").read_text()
+    except OSError:
+        return None
+    for line in packed_refs.splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+# Git state is read once per process; call .cache_clear() on these to re-read
+@functools.lru_cache(maxsize=1)
 def get_git_commit_hash() -> str:
+    commit_hash = _read_git_head(_GIT_DIR)
+    if commit_hash is not None:
+        return commit_hash
     return subprocess.check_output(["git", "rev-parse", "HEAD"]).decode("utf-8").strip()
 
 
+@functools.lru_cache(maxsize=1)
 def get_git_porcelain_status() -> bool:
     return (
         subprocess.check_output(["git", "status", "--porcelain"])
@@ -30,6 +65,7 @@ def get_git_porcelain_status() -> bool:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def get_git_summary() -> str:
     return (
         f"{get_git_commit_hash()}:{'clean' if get_git_porcelain_status() else 'dirty'}"
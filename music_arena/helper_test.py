@@ -1,6 +1,15 @@
+import os
+import pathlib
+import tempfile
 import unittest
 
-from music_arena.helper import checksum, create_uuid, salted_checksum
+from music_arena.helper import (
+    blake3,
+    checksum,
+    create_uuid,
+    load_with_file_cache,
+    salted_checksum,
+)
 
 
 class HelperTest(unittest.TestCase):
@@ -17,6 +26,22 @@ class HelperTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             checksum(b"test", strategy="sha256")
 
+    def test_checksum_file(self):
+        data = os.urandom(3 * (1 << 20) + 17)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "data.bin"
+            path.write_bytes(data)
+            self.assertEqual(checksum(path), checksum(data))
+
+    @unittest.skipIf(blake3 is None, "blake3 not installed")
+    def test_checksum_blake3(self):
+        expected = blake3.blake3(b"foo").hexdigest()
+        self.assertEqual(checksum("foo", strategy="blake3"), expected)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "foo.txt"
+            path.write_bytes(b"foo")
+            self.assertEqual(checksum(path, strategy="blake3"), expected)
+
     def test_salted_checksum(self):
         self.assertEqual(
             salted_checksum("foo", salt="salt1"), "90d11c5a73186f46fea58427d66acc5c"
@@ -37,6 +62,32 @@ class HelperTest(unittest.TestCase):
         )
         self.assertEqual(salted_checksum("foo", salt=""), checksum("foo"))
 
+    def test_load_with_file_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = pathlib.Path(temp_dir)
+            path = temp_dir / "config.txt"
+            path.write_text("foo")
+            calls = []
+
+            def load_fn(p):
+                calls.append(p)
+                return p.read_text()
+
+            def load():
+                return load_with_file_cache(
+                    path, load_fn, "test", cache_dir=temp_dir / "cache"
+                )
+
+            self.assertEqual(load(), "foo")
+            self.assertEqual(load(), "foo")
+            self.assertEqual(len(calls), 1)
+
+            # Changing the file invalidates the cache
+            path.write_text("barbaz")
+            os.utime(path, ns=(0, 0))
+            self.assertEqual(load(), "barbaz")
+            self.assertEqual(len(calls), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,57 +4,76 @@ import importlib.util
 import pathlib
 from typing import Optional
 
-import yaml
-
 from .dataclass import SystemKey, TextToMusicSystemMetadata
+from .helper import load_with_file_cache
 from .path import SYSTEMS_DIR, SYSTEMS_PRIVATE_DIR
 from .system import TextToMusicSystem
 
 
+def _load_registry_yaml(yaml_path: pathlib.Path) -> dict:
+    # Imported here so importing the registry doesn't pay for yaml up front
+    import yaml
+
+    # libyaml's C loader is much faster; PyYAML builds without it fall back
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(yaml_path, "r") as f:
+        return yaml.load(f, Loader=loader)
+
+
 @functools.lru_cache
 def _parse_registry(
     registry_dir: pathlib.Path,
 ) -> dict[SystemKey, TextToMusicSystemMetadata]:
     result = {}
     yaml_path = registry_dir / "registry.yaml"
-    with open(yaml_path, "r") as f:
-        for system_tag, system_kwargs in yaml.safe_load(f).items():
-            variants = system_kwargs.pop("variants", {})
-            if len(variants) == 0:
-                raise TypeError(f"System {system_tag} must have at least one variant")
-            for variant_tag, variant_kwargs in variants.items():
-                system_key = SystemKey(system_tag=system_tag, variant_tag=variant_tag)
-                combined_kwargs = system_kwargs.copy()
-                descriptions = [
-                    d
-                    for d in [
-                        system_kwargs.get("description", ""),
-                        variant_kwargs.get("description", ""),
-                    ]
-                    if len(d) > 0
+    registry = load_with_file_cache(yaml_path, _load_registry_yaml, "registry")
+    for system_tag, system_kwargs in registry.items():
+        variants = system_kwargs.pop("variants", {})
+        if len(variants) == 0:
+            raise TypeError(f"System {system_tag} must have at least one variant")
+        for variant_tag, variant_kwargs in variants.items():
+            system_key = SystemKey(system_tag=system_tag, variant_tag=variant_tag)
+            combined_kwargs = system_kwargs.copy()
+            descriptions = [
+                d
+                for d in [
+                    system_kwargs.get("description", ""),
+                    variant_kwargs.get("description", ""),
                 ]
-                combined_kwargs.update(variant_kwargs)
-                combined_kwargs["description"] = " ".join(descriptions)
-                if registry_dir == SYSTEMS_PRIVATE_DIR and not combined_kwargs.get(
-                    "private", False
-                ):
-                    raise ValueError(f"Private system {system_key} marked as public.")
-                try:
-                    system_metadata = TextToMusicSystemMetadata(
-                        key=system_key,
-                        registry_dir=registry_dir,
-                        **combined_kwargs,
-                    )
-                except TypeError as e:
-                    raise TypeError(
-                        f"Error parsing variant {variant_tag} for system {system_tag}: {e}"
-                    ) from e
-                result[system_key] = system_metadata
+                if len(d) > 0
+            ]
+            combined_kwargs.update(variant_kwargs)
+            combined_kwargs["description"] = " ".join(descriptions)
+            if registry_dir == SYSTEMS_PRIVATE_DIR and not combined_kwargs.get(
+                "private", False
+            ):
+                raise ValueError(f"Private system {system_key} marked as public.")
+            try:
+                system_metadata = TextToMusicSystemMetadata(
+                    key=system_key,
+                    registry_dir=registry_dir,
+                    **combined_kwargs,
+                )
+            except TypeError as e:
+                raise TypeError(
+                    f"Error parsing variant {variant_tag} for system {system_tag}: {e}"
+                ) from e
+            result[system_key] = system_metadata
     return result
 
 
 def get_registered_systems(
     registry_dirs: Optional[list[pathlib.Path]] = None,
+) -> dict[SystemKey, TextToMusicSystemMetadata]:
+    if registry_dirs is not None:
+        registry_dirs = tuple(registry_dirs)
+    # Copy so callers can't mutate the cached mapping
+    return dict(_get_registered_systems(registry_dirs))
+
+
+@functools.lru_cache
+def _get_registered_systems(
+    registry_dirs: Optional[tuple[pathlib.Path, ...]],
 ) -> dict[SystemKey, TextToMusicSystemMetadata]:
     if registry_dirs is None:
         registry_dirs = [SYSTEMS_DIR, SYSTEMS_PRIVATE_DIR]
@@ -70,9 +89,10 @@ def get_registered_systems(
 
 @functools.lru_cache
 def get_system_metadata(system_key: SystemKey) -> TextToMusicSystemMetadata:
-    if system_key not in get_registered_systems():
+    system_metadata = _get_registered_systems(None).get(system_key)
+    if system_metadata is None:
         raise ValueError(f"System {system_key} not found")
-    return get_registered_systems()[system_key]
+    return system_metadata
 
 
 def init_system(system_key: SystemKey, lazy: bool = True) -> TextToMusicSystem:
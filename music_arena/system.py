@@ -20,6 +20,9 @@ class PromptSupport(enum.Enum):
 
 
 class BaseAudioGenerationSystem(Generic[PromptT, ResponseT], abc.ABC):
+    # Set by systems that call asyncio.run from within a running event loop
+    needs_nested_loop: bool = False
+
     def __init__(self):
         self._ready = False
 
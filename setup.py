@@ -15,10 +15,12 @@ setup(
         "PyYAML",
         "numpy",
         "soundfile",
-        "resampy",
+        "numba",
         "openai",
+        "httpx",
         "fastapi",
         "uvicorn",
         "nest-asyncio",
+        "orjson",
     ],
 )
@@ -22,6 +22,8 @@ nest_asyncio.apply()
 
 
 class ACEStep(TextToMusicGPUSystem):
+    needs_nested_loop = True
+
     def __init__(
         self,
         duration: float = 30.0,
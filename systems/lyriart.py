@@ -26,6 +26,8 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class LyriaRealTime(TextToMusicAPISystem):
+    needs_nested_loop = True
+
     def __init__(
         self,
         *args,
@@ -18,6 +18,8 @@ nest_asyncio.apply()
 
 
 class MagentaRealTime(TextToMusicGPUSystem):
+    needs_nested_loop = True
+
     def __init__(
         self,
         tag: str = "large",
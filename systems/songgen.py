@@ -19,6 +19,8 @@ nest_asyncio.apply()
 
 
 class SongGen(TextToMusicGPUSystem):
+    needs_nested_loop = True
+
     def __init__(
         self,
         ckpt_path: str = "LiuZH-19/SongGen_mixed_pro",